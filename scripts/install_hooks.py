@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import os
 import stat
+from pathlib import Path
 
-HOOK_PATH = os.path.join(".git", "hooks", "post-commit")
+HOOK_PATH = Path(".git", "hooks", "post-commit")
 MARK = "# simutrador-gh-progress"
 
 SCRIPT = """#!/bin/sh
@@ -19,24 +19,19 @@ fi
 
 
 def main() -> int:
-    os.makedirs(os.path.dirname(HOOK_PATH), exist_ok=True)
-
-    if os.path.exists(HOOK_PATH):
-        with open(HOOK_PATH, "r", encoding="utf-8") as f:
-            content = f.read()
-        if MARK in content:
-            # Already installed
-            return 0
-        # Append our block safely
-        new_content = content.rstrip() + "\n\n" + SCRIPT.format(mark=MARK) + "\n"
-    else:
-        new_content = SCRIPT.format(mark=MARK) + "\n"
-
-    with open(HOOK_PATH, "w", encoding="utf-8") as f:
-        f.write(new_content)
-
-    st = os.stat(HOOK_PATH)
-    os.chmod(HOOK_PATH, st.st_mode | stat.S_IEXEC)
+    HOOK_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    existing = HOOK_PATH.read_text(encoding="utf-8") if HOOK_PATH.exists() else ""
+    if MARK in existing:
+        # Already installed
+        return 0
+
+    block = SCRIPT.format(mark=MARK) + "\n"
+    # Append our block safely
+    new_content = existing.rstrip() + "\n\n" + block if existing else block
+
+    HOOK_PATH.write_text(new_content, encoding="utf-8")
+    HOOK_PATH.chmod(HOOK_PATH.stat().st_mode | stat.S_IEXEC)
     return 0
 
 
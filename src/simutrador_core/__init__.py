@@ -8,45 +8,89 @@ This library provides:
 - Enums for order types, sides, and asset classifications
 - Utility functions for timeframe conversion, validation, and logging
 - Abstract interfaces for data providers and storage systems
+
+Re-exported names are resolved lazily (PEP 562) so that ``import simutrador_core``
+does not pay for building every Pydantic schema up front.
 """
 
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
 __version__ = "1.0.19"
 
-# Re-export commonly used models and utilities
-from simutrador_core.models import (
-    AccountSnapshotData,
-    # Asset classification
-    AssetType,
-    ExecutionReportData,
-    HealthStatus,
-    OrderBatchData,
-    OrderData,
-    OrderSide,
-    # Trading models
-    OrderType,
+if TYPE_CHECKING:
+    from simutrador_core.models import (
+        AccountSnapshotData,
+        # Asset classification
+        AssetType,
+        ExecutionReportData,
+        HealthStatus,
+        OrderBatchData,
+        OrderData,
+        OrderSide,
+        # Trading models
+        OrderType,
+        # Core data models
+        PriceCandle,
+        PriceDataSeries,
+        TickAckData,
+        TickData,
+        Timeframe,
+        # WebSocket communication
+        WSMessage,
+        get_asset_config,
+        get_resampling_offset,
+    )
+    from simutrador_core.utils import (
+        # Logging utilities
+        configure_third_party_loggers,
+        get_default_logger,
+        # Timeframe utilities
+        get_pandas_frequency,
+        get_resampling_rules,
+        get_supported_timeframes,
+        get_timeframe_minutes,
+        setup_logger,
+        validate_timeframe_conversion,
+    )
+
+# Public name -> submodule defining it (attribute name == public name)
+_EXPORTS: dict[str, str] = {
     # Core data models
-    PriceCandle,
-    PriceDataSeries,
-    TickAckData,
-    TickData,
-    Timeframe,
+    "PriceCandle": "simutrador_core.models.price_data",
+    "Timeframe": "simutrador_core.models.price_data",
+    "PriceDataSeries": "simutrador_core.models.price_data",
+    # Trading models
+    "OrderType": "simutrador_core.models.enums",
+    "OrderSide": "simutrador_core.models.enums",
+    "OrderData": "simutrador_core.models.websocket",
+    "OrderBatchData": "simutrador_core.models.websocket",
     # WebSocket communication
-    WSMessage,
-    get_asset_config,
-    get_resampling_offset,
-)
-from simutrador_core.utils import (
-    # Logging utilities
-    configure_third_party_loggers,
-    get_default_logger,
+    "WSMessage": "simutrador_core.models.websocket",
+    "HealthStatus": "simutrador_core.models.websocket",
+    "TickData": "simutrador_core.models.websocket",
+    "TickAckData": "simutrador_core.models.websocket",
+    "ExecutionReportData": "simutrador_core.models.websocket",
+    "AccountSnapshotData": "simutrador_core.models.websocket",
+    # Asset classification
+    "AssetType": "simutrador_core.models.asset_types",
+    "get_asset_config": "simutrador_core.models.asset_types",
+    "get_resampling_offset": "simutrador_core.models.asset_types",
     # Timeframe utilities
-    get_pandas_frequency,
-    get_resampling_rules,
-    get_supported_timeframes,
-    get_timeframe_minutes,
-    setup_logger,
-    validate_timeframe_conversion,
-)
+    "get_timeframe_minutes": "simutrador_core.utils.timeframe_utils",
+    "get_pandas_frequency": "simutrador_core.utils.timeframe_utils",
+    "validate_timeframe_conversion": "simutrador_core.utils.timeframe_utils",
+    "get_supported_timeframes": "simutrador_core.utils.timeframe_utils",
+    "get_resampling_rules": "simutrador_core.utils.timeframe_utils",
+    # Logging utilities
+    "setup_logger": "simutrador_core.utils.logging_utils",
+    "get_default_logger": "simutrador_core.utils.logging_utils",
+    "configure_third_party_loggers": "simutrador_core.utils.logging_utils",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
 
 __all__ = [
     "__version__",
@@ -0,0 +1,46 @@
+"""
+Lazy (PEP 562) re-exports shared by the package ``__init__`` modules.
+
+Each package lists its public names in an ``_EXPORTS`` mapping and installs the
+hooks built here, so a submodule is only imported when one of its names is
+first accessed.
+"""
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a lazy package.
+
+    Usage:
+        __getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+    Args:
+        package: Name of the re-exporting package (anchor for relative module names)
+        namespace: The package's ``globals()``; resolved values are cached there
+        exports: Public name -> module defining it (attribute name == public name)
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+
+    def module_getattr(name: str) -> Any:
+        """Resolve a re-exported name on first access and cache it in the module globals."""
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return module_getattr, module_dir
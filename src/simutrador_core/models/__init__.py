@@ -2,83 +2,113 @@
 SimuTrador Core Models
 
 Shared Pydantic models used across all SimuTrador components.
+
+Submodules are imported lazily (PEP 562): a model's schema is only built when
+the name is first accessed from this package.
 """
 
-# Price data models
-# Asset types
-from .asset_types import (
-    ASSET_TYPE_CONFIGS,
-    LONDON_FOREX_SESSION,
-    US_EQUITY_SESSION,
-    AssetType,
-    AssetTypeConfig,
-    MarketSession,
-    get_asset_config,
-    get_resampling_offset,
-    is_24_7_market,
-    should_use_session_alignment,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+from . import websocket
+
+if TYPE_CHECKING:
+    # Price data models
+    # Asset types
+    from .asset_types import (
+        ASSET_TYPE_CONFIGS,
+        LONDON_FOREX_SESSION,
+        US_EQUITY_SESSION,
+        AssetType,
+        AssetTypeConfig,
+        MarketSession,
+        get_asset_config,
+        get_resampling_offset,
+        is_24_7_market,
+        should_use_session_alignment,
+    )
+
+    # Enums
+    from .enums import (
+        ORDER_SIDE_BY_VALUE,
+        ORDER_TYPE_BY_VALUE,
+        WS_ERROR_CODE_BY_VALUE,
+        OrderSide,
+        OrderStatus,
+        OrderType,
+        SessionState,
+        TradeResult,
+        WSErrorCode,
+    )
+    from .position_store import PositionStore
+    from .price_data import (
+        CandleBatch,
+        DataUpdateStatus,
+        PaginationInfo,
+        PriceCandle,
+        PriceDataSeries,
+        PriceQuote,
+        Timeframe,
+    )
+    from .trading_state import (
+        OpenOrderState,
+        PositionBracketState,
+        SessionTradingState,
+        SymbolPriceState,
+    )
+
+    # WebSocket communication models
+    from .websocket import *  # noqa: F403
+
+# Public name -> submodule defining it (attribute name == public name)
+_EXPORTS: dict[str, str] = {
+    # Price data
+    "Timeframe": ".price_data",
+    "PriceCandle": ".price_data",
+    "CandleBatch": ".price_data",
+    "PaginationInfo": ".price_data",
+    "PriceDataSeries": ".price_data",
+    "PriceQuote": ".price_data",
+    "DataUpdateStatus": ".price_data",
+    # Enums
+    "OrderType": ".enums",
+    "OrderSide": ".enums",
+    "SessionState": ".enums",
+    "TradeResult": ".enums",
+    "WSErrorCode": ".enums",
+    "OrderStatus": ".enums",
+    "ORDER_TYPE_BY_VALUE": ".enums",
+    "ORDER_SIDE_BY_VALUE": ".enums",
+    "WS_ERROR_CODE_BY_VALUE": ".enums",
+    # Asset types
+    "AssetType": ".asset_types",
+    "MarketSession": ".asset_types",
+    "AssetTypeConfig": ".asset_types",
+    "US_EQUITY_SESSION": ".asset_types",
+    "LONDON_FOREX_SESSION": ".asset_types",
+    "ASSET_TYPE_CONFIGS": ".asset_types",
+    "get_asset_config": ".asset_types",
+    "get_resampling_offset": ".asset_types",
+    "should_use_session_alignment": ".asset_types",
+    "is_24_7_market": ".asset_types",
+    # Trading state models
+    "OpenOrderState": ".trading_state",
+    "PositionBracketState": ".trading_state",
+    "SessionTradingState": ".trading_state",
+    "SymbolPriceState": ".trading_state",
+    "PositionStore": ".position_store",
+    # WebSocket and REST authentication models (see websocket.__all__)
+    **dict.fromkeys(websocket.__all__, ".websocket"),
+}
 
-# Enums
-from .enums import (
-    OrderSide,
-    OrderStatus,
-    OrderType,
-    SessionState,
-    TradeResult,
-    WSErrorCode,
-)
-from .price_data import (
-    DataUpdateStatus,
-    PaginationInfo,
-    PriceCandle,
-    PriceDataSeries,
-    PriceQuote,
-    Timeframe,
-)
-from .trading_state import (
-    OpenOrderState,
-    PositionBracketState,
-    SessionTradingState,
-    SymbolPriceState,
-)
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
-# WebSocket communication models
-from .websocket import (
-    AccountSnapshotData,
-    BatchAckData,
-    ConnectionClosingData,
-    ConnectionReadyData,
-    ConnectionWarningData,
-    CreateSessionData,
-    ErrorData,
-    ExecutionReportData,
-    HealthStatus,
-    OrderBatchData,
-    OrderData,
-    PongData,
-    PositionData,
-    SessionCreatedData,
-    SessionCreatedResponseData,
-    SessionQueuedResponseData,
-    SimulationEndData,
-    SimulationStartData,
-    SimulationStartedData,
-    StartSimulationRequest,
-    TickAckData,
-    TickData,
-    TokenRequest,
-    TokenResponse,
-    UserLimitsResponse,
-    UserPlan,
-    WSMessage,
-    build_error,
-)
 
 __all__ = [
     # Price data
     "Timeframe",
     "PriceCandle",
+    "CandleBatch",
     "PaginationInfo",
     "PriceDataSeries",
     "PriceQuote",
@@ -90,6 +120,9 @@ __all__ = [
     "TradeResult",
     "WSErrorCode",
     "OrderStatus",
+    "ORDER_TYPE_BY_VALUE",
+    "ORDER_SIDE_BY_VALUE",
+    "WS_ERROR_CODE_BY_VALUE",
     # Asset types
     "AssetType",
     "MarketSession",
@@ -101,45 +134,11 @@ __all__ = [
     "get_resampling_offset",
     "should_use_session_alignment",
     "is_24_7_market",
-    # WebSocket models
-    "WSMessage",
-    "HealthStatus",
-    "PongData",
-    # Authentication models
-    "TokenRequest",
-    "TokenResponse",
-    "UserLimitsResponse",
-    "UserPlan",
-    # Connection models
-    "ConnectionReadyData",
-    "ConnectionWarningData",
-    "ConnectionClosingData",
-    # Session models
-    "CreateSessionData",
-    "SessionCreatedData",
-    "SessionCreatedResponseData",
-    "SessionQueuedResponseData",
-    "SimulationStartData",
-    "SimulationStartedData",
-    "StartSimulationRequest",
-    "TickData",
-    "TickAckData",
-    # Order models
-    "OrderData",
-    "OrderBatchData",
-    "BatchAckData",
-    "ExecutionReportData",
-    # Portfolio models
-    "PositionData",
-    "AccountSnapshotData",
     # Trading state models
     "OpenOrderState",
     "PositionBracketState",
     "SessionTradingState",
     "SymbolPriceState",
-    # Error and completion models
-    "ErrorData",
-    "SimulationEndData",
-    # Helpers
-    "build_error",
+    "PositionStore",
 ]
+__all__.extend(websocket.__all__)
@@ -0,0 +1,331 @@
+"""
+msgspec mirrors of the hot WebSocket wire models (internal fast path).
+
+Pydantic models remain the public API. These ``msgspec.Struct`` definitions
+exist only for the read path, where frames are decoded straight from bytes
+into typed structs and converted to Pydantic models at the API boundary.
+
+The ``*Frame`` structs carry the tick-rate payloads over the binary msgpack
+transport (``MSGPACK_SUBPROTOCOL``). They encode as positional arrays
+(``array_like=True``) inside a ``[type, payload]`` envelope, which keeps frames
+well under half the size of the equivalent JSON.
+
+Requires the optional ``fast`` extra (``pip install simutrador-core[fast]``):
+without msgspec, importing this module raises ``ImportError``. There is no
+automatic fallback; callers without the extra use the Pydantic decoders
+(``parse_ws_message``, ``decode_payload``) directly.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Any, Generic, Literal, TypeVar
+
+import msgspec
+from pydantic import BaseModel
+
+from .enums import OrderSide
+from .price_data import Timeframe
+from .websocket import (
+    WS_PAYLOAD_MODELS,
+    ExecutionMode,
+    MarketSessionPhase,
+    TimeInForce,
+    WSMessage,
+    WSOrderType,
+)
+
+DataT = TypeVar("DataT")
+
+# Same bounds as the Pydantic fields. msgspec only supports Meta bounds on
+# int/float, so Decimal fields are checked in __post_init__ (raised as
+# msgspec.ValidationError on decode).
+PositiveInt = Annotated[int, msgspec.Meta(gt=0)]
+
+
+def _check_positive(struct: msgspec.Struct, *names: str) -> None:
+    """Raise ``ValueError`` if any named Decimal field is set and not > 0."""
+    for name in names:
+        value: Decimal | None = getattr(struct, name)
+        if value is not None and value <= 0:
+            raise ValueError(f"{name} must be greater than 0")
+
+
+def _check_candle(struct: "PriceCandleFast | CandleFrame") -> None:
+    """Apply the ``PriceCandle`` field bounds (not its high/low range checks)."""
+    _check_positive(struct, "open", "low", "high", "close")
+    if struct.volume < 0:
+        raise ValueError("volume must be greater than or equal to 0")
+
+
+class WSMessageFast(msgspec.Struct, frozen=True):
+    """Mirror of ``WSMessage``."""
+
+    type: str
+    data: dict[str, Any]
+    request_id: str | None = None
+    timestamp: datetime | None = None
+
+
+class HealthStatusFast(msgspec.Struct, frozen=True):
+    """Mirror of ``HealthStatus``."""
+
+    status: Literal["ok", "degraded", "unhealthy"] = "ok"
+    server_time: datetime | None = None
+    server_version: str | None = None
+    message: str | None = None
+
+
+class PriceCandleFast(msgspec.Struct, frozen=True):
+    """Mirror of ``PriceCandle`` (no high/low range checks)."""
+
+    date: datetime
+    open: Decimal
+    low: Decimal
+    high: Decimal
+    close: Decimal
+    volume: Decimal
+
+    def __post_init__(self) -> None:
+        _check_candle(self)
+
+
+class TickDataFast(msgspec.Struct, frozen=True):
+    """Mirror of ``TickData``."""
+
+    sim_time: datetime
+    sequence_id: int
+    timeframe: Timeframe | None = None
+    candles: dict[str, PriceCandleFast] | None = None
+    market_session: MarketSessionPhase | None = None
+    symbols_trading: list[str] | None = None
+    is_eod: bool = False
+
+
+class OrderDataFast(msgspec.Struct, frozen=True):
+    """Mirror of ``OrderData``."""
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    type: WSOrderType
+    quantity: PositiveInt
+    price: Decimal | None = None
+    stop_loss: Decimal | None = None
+    take_profit: Decimal | None = None
+    time_in_force: TimeInForce = "day"
+
+    def __post_init__(self) -> None:
+        _check_positive(self, "price", "stop_loss", "take_profit")
+
+
+class OrderBatchDataFast(msgspec.Struct, frozen=True):
+    """Mirror of ``OrderBatchData``."""
+
+    batch_id: str
+    orders: list[OrderDataFast]
+    execution_mode: ExecutionMode = "best_effort"
+    parent_strategy: str | None = None
+
+
+class TypedMessageFast(msgspec.Struct, Generic[DataT], frozen=True):
+    """Envelope with a typed payload, e.g. ``TypedMessageFast[TickDataFast]``."""
+
+    type: str
+    data: DataT
+    request_id: str | None = None
+    timestamp: datetime | None = None
+
+
+# Decoder construction is comparatively expensive; build once and reuse.
+_WS_DECODER = msgspec.json.Decoder(WSMessageFast)
+
+# Message type -> decoder for the typed envelope of that type
+_DECODERS: dict[str, msgspec.json.Decoder[Any]] = {
+    "health": msgspec.json.Decoder(TypedMessageFast[HealthStatusFast]),
+    "tick": msgspec.json.Decoder(TypedMessageFast[TickDataFast]),
+    "order_batch": msgspec.json.Decoder(TypedMessageFast[OrderBatchDataFast]),
+}
+
+_TYPE_KEY = b'"type"'
+
+
+def decode_ws(buf: bytes | bytearray | memoryview | str) -> WSMessageFast:
+    """Decode a raw WebSocket frame into a ``WSMessageFast`` envelope."""
+    return _WS_DECODER.decode(buf)
+
+
+def to_ws_message(msg: WSMessageFast) -> WSMessage:
+    """Convert a fast envelope into the public Pydantic ``WSMessage``."""
+    return WSMessage.model_validate(msgspec.structs.asdict(msg))
+
+
+def peek_type(buf: bytes | bytearray) -> str | None:
+    """
+    Extract the envelope ``type`` with plain byte scans (no JSON parse).
+
+    Assumes the envelope's ``type`` key precedes any nested ``type`` key, which
+    holds for frames produced by this library. The result is only a routing
+    hint: ``decode_typed`` verifies it against the decoded message.
+    """
+    start = buf.find(_TYPE_KEY)
+    if start < 0:
+        return None
+    start = buf.find(b'"', start + len(_TYPE_KEY))
+    end = buf.find(b'"', start + 1) if start >= 0 else -1
+    if end < 0:
+        return None
+    return bytes(buf[start + 1 : end]).decode("utf-8", "replace")
+
+
+def decode_typed(buf: bytes | bytearray) -> TypedMessageFast[Any] | WSMessage:
+    """
+    Decode a frame with the msgspec decoder registered for its type.
+
+    Frames with unknown types (or a misleading ``type`` peek) fall back to
+    the Pydantic ``WSMessage``. Payload errors for known types are raised as
+    ``msgspec.ValidationError``.
+    """
+    message_type = peek_type(buf)
+    decoder = _DECODERS.get(message_type) if message_type is not None else None
+    if decoder is not None:
+        try:
+            message: TypedMessageFast[Any] = decoder.decode(buf)
+        except msgspec.ValidationError:
+            if _WS_DECODER.decode(buf).type == message_type:
+                raise
+        else:
+            if message.type == message_type:
+                return message
+    return WSMessage.from_json_bytes(buf)
+
+
+# ===== MSGPACK TRANSPORT =====
+
+# Value of the ``Sec-WebSocket-Protocol`` header selecting the msgpack transport
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+
+class CandleFrame(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """Positional msgpack encoding of ``PriceCandle``."""
+
+    date: datetime
+    open: Decimal
+    low: Decimal
+    high: Decimal
+    close: Decimal
+    volume: Decimal
+
+    def __post_init__(self) -> None:
+        _check_candle(self)
+
+
+class TickFrame(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """Positional msgpack encoding of ``TickData``."""
+
+    sim_time: datetime
+    sequence_id: int
+    timeframe: Timeframe | None = None
+    candles: dict[str, CandleFrame] | None = None
+    market_session: MarketSessionPhase | None = None
+    symbols_trading: list[str] | None = None
+    is_eod: bool = False
+
+
+class OrderFrame(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """Positional msgpack encoding of ``OrderData``."""
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    type: WSOrderType
+    quantity: PositiveInt
+    price: Decimal | None = None
+    stop_loss: Decimal | None = None
+    take_profit: Decimal | None = None
+    time_in_force: TimeInForce = "day"
+
+    def __post_init__(self) -> None:
+        _check_positive(self, "price", "stop_loss", "take_profit")
+
+
+class OrderBatchFrame(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """Positional msgpack encoding of ``OrderBatchData``."""
+
+    batch_id: str
+    orders: list[OrderFrame]
+    execution_mode: ExecutionMode = "best_effort"
+    parent_strategy: str | None = None
+
+
+class ExecutionReportFrame(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """Positional msgpack encoding of ``ExecutionReportData``."""
+
+    execution_id: str
+    order_id: str
+    symbol: str
+    executed_quantity: PositiveInt
+    executed_price: Decimal
+    commission: Decimal
+    slippage_bps: int
+    timestamp: datetime | None = None
+
+    def __post_init__(self) -> None:
+        _check_positive(self, "executed_price")
+
+
+# Message type -> frame struct carried over the msgpack transport
+_MSGPACK_FRAMES: dict[str, type[msgspec.Struct]] = {
+    "tick": TickFrame,
+    "order_batch": OrderBatchFrame,
+    "execution_report": ExecutionReportFrame,
+}
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_ENVELOPE_DECODER = msgspec.msgpack.Decoder(tuple[str, msgspec.Raw])
+_MSGPACK_DECODERS: dict[str, msgspec.msgpack.Decoder[Any]] = {
+    message_type: msgspec.msgpack.Decoder(frame) for message_type, frame in _MSGPACK_FRAMES.items()
+}
+
+
+def encode_msgpack(message_type: str, payload: BaseModel | msgspec.Struct) -> bytes:
+    """
+    Encode a payload as a msgpack ``[type, frame]`` envelope.
+
+    Args:
+        message_type: Message type with a registered frame ('tick', 'order_batch',
+            'execution_report')
+        payload: Pydantic payload model (read by attribute) or a ready-made frame
+
+    Returns:
+        msgpack-encoded frame bytes
+
+    Raises:
+        KeyError: If the message type has no msgpack frame
+    """
+    frame_type = _MSGPACK_FRAMES[message_type]
+    if not isinstance(payload, frame_type):
+        payload = msgspec.convert(payload, frame_type, from_attributes=True)
+    return _MSGPACK_ENCODER.encode((message_type, payload))
+
+
+def decode_msgpack(buf: bytes | bytearray | memoryview) -> tuple[str, msgspec.Struct]:
+    """
+    Decode a msgpack envelope into its message type and typed frame.
+
+    Args:
+        buf: Raw binary WebSocket frame
+
+    Returns:
+        Tuple of (message type, frame struct)
+
+    Raises:
+        KeyError: If the message type has no msgpack frame
+        msgspec.ValidationError: If the payload does not match the frame schema
+    """
+    message_type, raw = _MSGPACK_ENVELOPE_DECODER.decode(buf)
+    return message_type, _MSGPACK_DECODERS[message_type].decode(raw)
+
+
+def frame_to_model(message_type: str, frame: msgspec.Struct) -> BaseModel:
+    """Convert a decoded frame into its public Pydantic payload model."""
+    return WS_PAYLOAD_MODELS[message_type].model_validate(frame, from_attributes=True)
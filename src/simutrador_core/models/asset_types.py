@@ -7,6 +7,7 @@ trading hours, resampling alignment strategies, and market session boundaries.
 
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 
 class AssetType(str, Enum):
@@ -20,7 +21,7 @@ class AssetType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MarketSession:
     """Market session information for an asset type."""
 
@@ -47,7 +48,7 @@ class MarketSession:
         return f"{self.open_utc_hour}h{self.open_utc_minute:02d}min"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AssetTypeConfig:
     """Configuration for an asset type including market characteristics."""
 
@@ -86,7 +87,7 @@ LONDON_FOREX_SESSION = MarketSession(
 )
 
 # Asset type configurations
-ASSET_TYPE_CONFIGS = {
+_ASSET_TYPE_CONFIGS = {
     AssetType.US_EQUITY: AssetTypeConfig(
         asset_type=AssetType.US_EQUITY,
         name="US Equity",
@@ -137,6 +138,16 @@ ASSET_TYPE_CONFIGS = {
     ),
 }
 
+# Read-only public view of the configurations
+ASSET_TYPE_CONFIGS: MappingProxyType[AssetType, AssetTypeConfig] = MappingProxyType(
+    _ASSET_TYPE_CONFIGS
+)
+
+# Precomputed per-asset-type resampling offsets (configs are immutable)
+_RESAMPLING_OFFSETS: dict[AssetType, str | None] = {
+    asset_type: config.resampling_offset for asset_type, config in _ASSET_TYPE_CONFIGS.items()
+}
+
 
 def get_asset_config(asset_type: AssetType) -> AssetTypeConfig:
     """
@@ -148,7 +159,7 @@ def get_asset_config(asset_type: AssetType) -> AssetTypeConfig:
     Returns:
         AssetTypeConfig for the specified asset type
     """
-    return ASSET_TYPE_CONFIGS[asset_type]
+    return _ASSET_TYPE_CONFIGS[asset_type]
 
 
 def get_resampling_offset(asset_type: AssetType) -> str | None:
@@ -166,8 +177,7 @@ def get_resampling_offset(asset_type: AssetType) -> str | None:
         - CRYPTO: None (standard UTC alignment: 00:00, 00:05, etc.)
         - FOREX: "8h00min" (London session open)
     """
-    config = get_asset_config(asset_type)
-    return config.resampling_offset
+    return _RESAMPLING_OFFSETS[asset_type]
 
 
 def should_use_session_alignment(asset_type: AssetType) -> bool:
@@ -2,6 +2,7 @@
 Enums for the Trading Simulator API.
 """
 
+import sys
 from enum import Enum
 
 
@@ -62,3 +63,24 @@ class WSErrorCode(str, Enum):
     AUTH_FAILED = "AUTH_FAILED"
     RATE_LIMITED = "RATE_LIMITED"
     HANDLER_TIMEOUT = "HANDLER_TIMEOUT"
+
+
+def intern_enum_values(*enums: type[Enum]) -> None:
+    """Seed the interned-string table with every member value of the given enums.
+
+    Strings interned later (e.g. at validation time, see WSMessage.type) are then
+    pointer-equal to the enum values. Call once right after defining a wire enum.
+    """
+    for enum in enums:
+        for member in enum:
+            sys.intern(member.value)
+
+
+intern_enum_values(OrderType, OrderSide, TradeResult, SessionState, OrderStatus, WSErrorCode)
+
+
+# Value -> member lookup tables for resolving wire strings outside of pydantic
+# validation (a plain dict probe instead of the ``Enum(value)`` metaclass call).
+ORDER_TYPE_BY_VALUE: dict[str, OrderType] = {m.value: m for m in OrderType}
+ORDER_SIDE_BY_VALUE: dict[str, OrderSide] = {m.value: m for m in OrderSide}
+WS_ERROR_CODE_BY_VALUE: dict[str, WSErrorCode] = {m.value: m for m in WSErrorCode}
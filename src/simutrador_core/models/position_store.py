@@ -0,0 +1,184 @@
+"""Struct-of-arrays position store for per-tick mark-to-market.
+
+``PositionStore`` keeps the authoritative position state as parallel NumPy
+arrays indexed through a symbol lookup, so per-tick price updates and PnL
+passes are vectorized (see ``utils.pnl_kernels``). ``PositionData`` and
+``AccountSnapshotData`` models are only built when a snapshot is sent.
+"""
+
+from collections.abc import Iterator, Mapping
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+
+from ..utils.fixed_point import PRICE_SCALE, from_minor_units, to_minor_units
+from ..utils.pnl_kernels import PriceArray, QtyArray, mark_to_market
+from .websocket import AccountSnapshotData, PositionData
+
+
+class PositionStore:
+    """Open positions held as parallel arrays, one row per symbol.
+
+    Quantities and average costs (as integer minor units) are exact; the
+    float64 price columns feed the mark-to-market kernel.
+
+    Usage:
+        store = PositionStore()
+        store.set_position("AAPL", 100, Decimal("187.25"))
+        store.update_prices({"AAPL": 188.10})
+        snapshot = store.to_snapshot(cash=Decimal("81275.00"))
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        Args:
+            capacity: Initial number of rows; arrays grow by doubling when full
+        """
+        capacity = max(capacity, 1)
+        self._index: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._qty: QtyArray = np.zeros(capacity, dtype=np.int64)
+        self._avg_cost_units: QtyArray = np.zeros(capacity, dtype=np.int64)
+        self._avg_cost: PriceArray = np.zeros(capacity, dtype=np.float64)
+        self._last_px: PriceArray = np.zeros(capacity, dtype=np.float64)
+        self._market_value: PriceArray = np.zeros(capacity, dtype=np.float64)
+        self._unrealized_pnl: PriceArray = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+
+    def _grow(self) -> None:
+        size = self._qty.shape[0]
+        capacity = size * 2
+        qty = np.zeros(capacity, dtype=np.int64)
+        avg_cost_units = np.zeros(capacity, dtype=np.int64)
+        avg_cost = np.zeros(capacity, dtype=np.float64)
+        last_px = np.zeros(capacity, dtype=np.float64)
+        qty[:size] = self._qty
+        avg_cost_units[:size] = self._avg_cost_units
+        avg_cost[:size] = self._avg_cost
+        last_px[:size] = self._last_px
+        self._qty = qty
+        self._avg_cost_units = avg_cost_units
+        self._avg_cost = avg_cost
+        self._last_px = last_px
+        self._market_value = np.zeros(capacity, dtype=np.float64)
+        self._unrealized_pnl = np.zeros(capacity, dtype=np.float64)
+
+    def set_position(self, symbol: str, quantity: int, avg_cost: Decimal) -> None:
+        """
+        Insert or overwrite the position for a symbol.
+
+        A new symbol's last price starts at its average cost until the first
+        ``update_prices`` call.
+
+        Args:
+            symbol: Trading symbol
+            quantity: Signed quantity (negative for shorts)
+            avg_cost: Average entry cost per unit
+        """
+        row = self._index.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row == self._qty.shape[0]:
+                self._grow()
+            self._index[symbol] = row
+            self._symbols.append(symbol)
+            self._last_px[row] = float(avg_cost)
+        units = to_minor_units(avg_cost)
+        self._qty[row] = quantity
+        self._avg_cost_units[row] = units
+        self._avg_cost[row] = units / PRICE_SCALE
+
+    def remove(self, symbol: str) -> None:
+        """
+        Drop a symbol's position by moving the last row into its slot.
+
+        Raises:
+            KeyError: If the symbol has no position
+        """
+        row = self._index.pop(symbol)
+        last = len(self._symbols) - 1
+        moved = self._symbols.pop()
+        if row != last:
+            self._symbols[row] = moved
+            self._index[moved] = row
+            for column in (
+                self._qty,
+                self._avg_cost_units,
+                self._avg_cost,
+                self._last_px,
+                self._market_value,
+                self._unrealized_pnl,
+            ):
+                column[row] = column[last]
+
+    def update_prices(self, prices: Mapping[str, float | Decimal]) -> None:
+        """
+        Record the latest prices; symbols without a position are ignored.
+
+        Args:
+            prices: Symbol -> last traded price (e.g., candle closes of a tick)
+        """
+        index = self._index
+        last_px = self._last_px
+        for symbol, price in prices.items():
+            row = index.get(symbol)
+            if row is not None:
+                last_px[row] = float(price)
+
+    def mark(self) -> tuple[PriceArray, PriceArray]:
+        """
+        Recompute market value and unrealized PnL for all positions.
+
+        Returns:
+            Views of the (market value, unrealized PnL) columns, row-aligned with
+            iteration order; they are overwritten by the next call
+        """
+        n = len(self._symbols)
+        mark_to_market(
+            self._qty[:n],
+            self._avg_cost[:n],
+            self._last_px[:n],
+            self._market_value[:n],
+            self._unrealized_pnl[:n],
+        )
+        return self._market_value[:n], self._unrealized_pnl[:n]
+
+    def to_positions(self) -> list[PositionData]:
+        """Materialize the positions as ``PositionData`` models."""
+        n = len(self._symbols)
+        return [
+            PositionData(symbol=symbol, quantity=quantity, avg_cost=from_minor_units(units))
+            for symbol, quantity, units in zip(
+                self._symbols,
+                self._qty[:n].tolist(),
+                self._avg_cost_units[:n].tolist(),
+                strict=True,
+            )
+        ]
+
+    def to_snapshot(self, cash: Decimal, **extra: Any) -> AccountSnapshotData:
+        """
+        Build an ``AccountSnapshotData`` from the current arrays.
+
+        Equity is ``cash`` plus the marked market value of all positions,
+        rounded to ``PRICE_DECIMALS`` places.
+
+        Args:
+            cash: Available cash balance
+            **extra: Optional snapshot fields (buying_power, day_pnl, open_orders)
+
+        Returns:
+            Snapshot ready to send
+        """
+        market_value, _ = self.mark()
+        equity = cash + from_minor_units(round(float(market_value.sum()) * PRICE_SCALE))
+        return AccountSnapshotData(cash=cash, equity=equity, positions=self.to_positions(), **extra)
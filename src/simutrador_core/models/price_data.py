@@ -4,14 +4,17 @@ Price data models for the Trading Simulator API.
 These models represent price candle data from external APIs and internal storage.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Self
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer, model_validator
 from typing_extensions import override
 
+from ..utils.fixed_point import from_minor_units, to_minor_units
+
 
 class Timeframe(str, Enum):
     """Supported timeframes for price data and simulation."""
@@ -58,15 +61,98 @@ class PriceCandle(BaseModel):
         """Serialize volume field to 8 decimal places for crypto precision."""
         return f"{value:.8f}"
 
-    @override
-    def model_post_init(self, __context: Any) -> None:
+    @model_validator(mode="after")
+    def _check_price_range(self) -> Self:
         """Validate that high >= low and open/close are within range."""
-        if self.high < self.low:
+        low, high = self.low, self.high
+        if high < low:
             raise ValueError("High price must be greater than or equal to low price")
-        if not (self.low <= self.open <= self.high):
+        if not (low <= self.open <= high):
             raise ValueError("Open price must be between low and high prices")
-        if not (self.low <= self.close <= self.high):
+        if not (low <= self.close <= high):
             raise ValueError("Close price must be between low and high prices")
+        return self
+
+
+class CandleBatch(BaseModel):
+    """
+    Columnar (struct-of-arrays) form of a set of per-symbol candles.
+
+    Row ``i`` of every column describes ``symbols[i]``. Prices and volumes are
+    integer minor units (see ``utils.fixed_point``), so a batch of N candles is
+    six flat lists instead of N models holding five ``Decimal`` values each,
+    and columns load straight into arrays (e.g. ``numpy.asarray(batch.close)``).
+    """
+
+    symbols: list[str] = Field(..., description="Symbol of each row")
+    dates: list[datetime] = Field(..., description="Candle timestamp of each row")
+    open: list[int] = Field(..., description="Opening prices in minor units")
+    high: list[int] = Field(..., description="Highest prices in minor units")
+    low: list[int] = Field(..., description="Lowest prices in minor units")
+    close: list[int] = Field(..., description="Closing prices in minor units")
+    volume: list[int] = Field(..., description="Trading volumes in minor units")
+
+    @model_validator(mode="after")
+    def _check_column_lengths(self) -> Self:
+        """Validate that every column has one value per symbol."""
+        n = len(self.symbols)
+        columns = (self.dates, self.open, self.high, self.low, self.close, self.volume)
+        if any(len(column) != n for column in columns):
+            raise ValueError("All candle columns must have the same length as symbols")
+        return self
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_candles(cls, candles: Mapping[str, PriceCandle]) -> "CandleBatch":
+        """
+        Build a batch from a symbol -> candle mapping (e.g. ``TickData.candles``).
+
+        Args:
+            candles: Mapping of symbol to candle
+
+        Returns:
+            Batch with rows in the mapping's iteration order
+        """
+        values = list(candles.values())
+        return cls(
+            symbols=list(candles),
+            dates=[candle.date for candle in values],
+            open=[to_minor_units(candle.open) for candle in values],
+            high=[to_minor_units(candle.high) for candle in values],
+            low=[to_minor_units(candle.low) for candle in values],
+            close=[to_minor_units(candle.close) for candle in values],
+            volume=[to_minor_units(candle.volume) for candle in values],
+        )
+
+    def as_dict(self) -> dict[str, PriceCandle]:
+        """
+        Materialize the rows as a symbol -> ``PriceCandle`` mapping.
+
+        Returns:
+            Validated candles keyed by symbol
+        """
+        return {
+            symbol: PriceCandle(
+                date=date,
+                open=from_minor_units(open_),
+                high=from_minor_units(high),
+                low=from_minor_units(low),
+                close=from_minor_units(close),
+                volume=from_minor_units(volume),
+            )
+            for symbol, date, open_, high, low, close, volume in zip(
+                self.symbols,
+                self.dates,
+                self.open,
+                self.high,
+                self.low,
+                self.close,
+                self.volume,
+                strict=True,
+            )
+        }
 
 
 class PaginationInfo(BaseModel):
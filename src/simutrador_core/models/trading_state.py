@@ -9,12 +9,12 @@ or serialize the internal trading state.
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Literal
+from typing import Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 from .enums import OrderSide, OrderStatus
-from .websocket import PositionData
+from .websocket import PositionData, TimeInForce
 
 
 class OpenOrderState(BaseModel):
@@ -24,26 +24,52 @@ class OpenOrderState(BaseModel):
     lifecycle status and bracket configuration. It is not sent directly
     over the wire; instead, it is used to derive ExecutionReportData and
     AccountSnapshotData.
+
+    For hot-path updates from trusted server code use
+    ``state.model_copy(update={...})``: it shallow-copies without
+    re-validating, so updated values must already have the field types.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     order_id: str
     symbol: str
     side: OrderSide
     quantity: int
-    stop_loss: Decimal | None = None
-    take_profit: Decimal | None = None
+    # Floats for cheap per-tick trigger comparisons; see the *_decimal properties
+    stop_loss: float | None = None
+    take_profit: float | None = None
     status: OrderStatus = OrderStatus.OPEN
 
+    @property
+    def stop_loss_decimal(self) -> Decimal | None:
+        """Stop-loss level as a Decimal for display and reporting."""
+        return None if self.stop_loss is None else Decimal(str(self.stop_loss))
+
+    @property
+    def take_profit_decimal(self) -> Decimal | None:
+        """Take-profit level as a Decimal for display and reporting."""
+        return None if self.take_profit is None else Decimal(str(self.take_profit))
+
 
 class SymbolPriceState(BaseModel):
     """Last known price for a symbol within a simulation session.
 
     Used by the execution engine to evaluate order fills and bracket
-    triggers based on the latest candle close.
+    triggers based on the latest candle close. The price is held as a float
+    because it is replaced on every tick; use ``last_price_decimal`` at
+    API/reporting boundaries.
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     symbol: str
-    last_price: Decimal
+    last_price: float
+
+    @property
+    def last_price_decimal(self) -> Decimal:
+        """Last price as a Decimal for display and reporting."""
+        return Decimal(str(self.last_price))
 
 
 class PositionBracketState(BaseModel):
@@ -54,13 +80,25 @@ class PositionBracketState(BaseModel):
     directly over the wire.
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     symbol: str
     side: OrderSide
     quantity: int
-    stop_loss: Decimal | None = None
-    take_profit: Decimal | None = None
-    time_in_force: Literal["day", "gtc", "ioc"] = "day"
+    # Floats for cheap per-tick trigger comparisons; see the *_decimal properties
+    stop_loss: float | None = None
+    take_profit: float | None = None
+    time_in_force: TimeInForce = "day"
+
+    @property
+    def stop_loss_decimal(self) -> Decimal | None:
+        """Stop-loss level as a Decimal for display and reporting."""
+        return None if self.stop_loss is None else Decimal(str(self.stop_loss))
 
+    @property
+    def take_profit_decimal(self) -> Decimal | None:
+        """Take-profit level as a Decimal for display and reporting."""
+        return None if self.take_profit is None else Decimal(str(self.take_profit))
 
 
 class SessionTradingState(BaseModel):
@@ -68,12 +106,72 @@ class SessionTradingState(BaseModel):
 
     This state is typically stored inside ``SimulationSession.metadata``
     on the server side and updated on each tick and order event.
+
+    Collections are keyed for O(1) lookups: ``positions``, ``last_prices``
+    and ``brackets`` by symbol, ``open_orders`` by order_id. The legacy
+    list layout is still accepted on input and keyed automatically.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     cash: Decimal
-    positions: list[PositionData] = []
-    open_orders: list[OpenOrderState] = []
-    last_prices: list[SymbolPriceState] = []
+    positions: dict[str, PositionData] = {}
+    open_orders: dict[str, OpenOrderState] = {}
+    last_prices: dict[str, SymbolPriceState] = {}
     trade_count: int = 0
-    brackets: list[PositionBracketState] = []
-
+    brackets: dict[str, PositionBracketState] = {}
+
+    @field_validator("positions", "last_prices", "brackets", mode="before")
+    @classmethod
+    def _key_by_symbol(cls, value: Any) -> Any:
+        """Migrate legacy list input to a symbol-keyed dict."""
+        return _key_list(value, "symbol")
+
+    @field_validator("open_orders", mode="before")
+    @classmethod
+    def _key_by_order_id(cls, value: Any) -> Any:
+        """Migrate legacy list input to an order_id-keyed dict."""
+        return _key_list(value, "order_id")
+
+    @model_validator(mode="after")
+    def _check_keys(self) -> SessionTradingState:
+        """Validate that every dict key matches its item's symbol/order_id."""
+        for field, attr, items in (
+            ("positions", "symbol", self.positions),
+            ("last_prices", "symbol", self.last_prices),
+            ("brackets", "symbol", self.brackets),
+            ("open_orders", "order_id", self.open_orders),
+        ):
+            for key, item in items.items():
+                if getattr(item, attr) != key:
+                    value = getattr(item, attr)
+                    raise ValueError(f"{field} key {key!r} does not match item {attr} {value!r}")
+        return self
+
+    def positions_list(self) -> list[PositionData]:
+        """Positions as a list, e.g. for ``AccountSnapshotData.positions``."""
+        return list(self.positions.values())
+
+
+def _key_list(value: Any, key: str) -> Any:
+    """Key a list of dicts/models by ``key``; other values pass through unchanged.
+
+    Raises ``ValueError`` (reported as a ValidationError) if an item lacks the
+    key, the key is not a string, or two items share it.
+    """
+    if not isinstance(value, list):
+        return value
+    keyed: dict[str, Any] = {}
+    for item in cast(list[Any], value):
+        if isinstance(item, dict):
+            item_key = cast(dict[str, Any], item).get(key)
+        else:
+            item_key = getattr(item, key, None)
+        if item_key is None:
+            raise ValueError(f"list item is missing {key!r}")
+        if not isinstance(item_key, str):
+            raise ValueError(f"{key} must be a string, got {type(item_key).__name__}")
+        if item_key in keyed:
+            raise ValueError(f"duplicate {key} {item_key!r}")
+        keyed[item_key] = item
+    return keyed
@@ -0,0 +1,235 @@
+"""
+WebSocket protocol and REST authentication models.
+
+``core`` holds the WebSocket message models and codecs; ``admin`` holds the REST
+token and rate-limit models. Names are re-exported lazily (PEP 562), so importing
+one side does not build the other's schemas.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admin import (
+        TokenRequest,
+        TokenResponse,
+        UserLimitsResponse,
+        UserPlan,
+    )
+    from .core import (
+        ANY_WS_MESSAGE_ADAPTER,
+        ERROR_SEVERITIES,
+        ERROR_TYPES,
+        EXECUTION_MODES,
+        HEALTH_ADAPTER,
+        MARKET_SESSION_PHASES,
+        ORDER_BATCH_ADAPTER,
+        ORDERS_ADAPTER,
+        PROCESSING_STATUSES,
+        TIME_IN_FORCE_VALUES,
+        WS_MESSAGE_ADAPTER,
+        WS_ORDER_TYPE_BY_VALUE,
+        WS_PAYLOAD_MODELS,
+        AccountSnapshotData,
+        AccountSnapshotMessage,
+        AnyWSMessage,
+        BatchAckData,
+        BatchAckMessage,
+        BatchedMessagesData,
+        BatchMessage,
+        ConnectionClosingData,
+        ConnectionReadyData,
+        ConnectionWarningData,
+        CreateSessionData,
+        ErrorData,
+        ErrorSeverity,
+        ErrorType,
+        ExecutionMode,
+        ExecutionReportData,
+        ExecutionReportMessage,
+        HealthMessage,
+        HealthStatus,
+        HistorySnapshotData,
+        HistorySnapshotMessage,
+        MarketSessionPhase,
+        OrderBatchData,
+        OrderBatchMessage,
+        OrderData,
+        PongData,
+        PongMessage,
+        PositionData,
+        ProcessingStatus,
+        SessionCreatedData,
+        SessionCreatedResponseData,
+        SessionQueuedResponseData,
+        SimulationEndData,
+        SimulationEndMessage,
+        SimulationStartData,
+        SimulationStartedData,
+        StartSimulationRequest,
+        TickAckData,
+        TickAckMessage,
+        TickData,
+        TickMessage,
+        TimeInForce,
+        TypedWSMessage,
+        WSMessage,
+        WSOrderType,
+        build_error,
+        decode_payload,
+        encode_tick_message,
+        parse_ws_message,
+        ws_message_from_json,
+        ws_message_to_json,
+    )
+
+# Public name -> submodule defining it (attribute name == public name)
+_EXPORTS: dict[str, str] = {
+    # REST authentication
+    "UserPlan": ".admin",
+    "TokenRequest": ".admin",
+    "TokenResponse": ".admin",
+    "UserLimitsResponse": ".admin",
+    # WebSocket protocol
+    "MarketSessionPhase": ".core",
+    "ProcessingStatus": ".core",
+    "TimeInForce": ".core",
+    "ExecutionMode": ".core",
+    "ErrorType": ".core",
+    "ErrorSeverity": ".core",
+    "MARKET_SESSION_PHASES": ".core",
+    "PROCESSING_STATUSES": ".core",
+    "TIME_IN_FORCE_VALUES": ".core",
+    "EXECUTION_MODES": ".core",
+    "ERROR_TYPES": ".core",
+    "ERROR_SEVERITIES": ".core",
+    "WSMessage": ".core",
+    "PongData": ".core",
+    "HealthStatus": ".core",
+    "ConnectionReadyData": ".core",
+    "ConnectionWarningData": ".core",
+    "ConnectionClosingData": ".core",
+    "CreateSessionData": ".core",
+    "StartSimulationRequest": ".core",
+    "SessionCreatedData": ".core",
+    "SessionCreatedResponseData": ".core",
+    "SessionQueuedResponseData": ".core",
+    "SimulationStartData": ".core",
+    "SimulationStartedData": ".core",
+    "HistorySnapshotData": ".core",
+    "TickData": ".core",
+    "TickAckData": ".core",
+    "WSOrderType": ".core",
+    "OrderData": ".core",
+    "OrderBatchData": ".core",
+    "BatchAckData": ".core",
+    "ExecutionReportData": ".core",
+    "PositionData": ".core",
+    "AccountSnapshotData": ".core",
+    "build_error": ".core",
+    "ErrorData": ".core",
+    "SimulationEndData": ".core",
+    "BatchedMessagesData": ".core",
+    "TypedWSMessage": ".core",
+    "HealthMessage": ".core",
+    "PongMessage": ".core",
+    "HistorySnapshotMessage": ".core",
+    "TickMessage": ".core",
+    "TickAckMessage": ".core",
+    "OrderBatchMessage": ".core",
+    "BatchAckMessage": ".core",
+    "ExecutionReportMessage": ".core",
+    "AccountSnapshotMessage": ".core",
+    "SimulationEndMessage": ".core",
+    "BatchMessage": ".core",
+    "WS_PAYLOAD_MODELS": ".core",
+    "WS_ORDER_TYPE_BY_VALUE": ".core",
+    "AnyWSMessage": ".core",
+    "WS_MESSAGE_ADAPTER": ".core",
+    "ORDER_BATCH_ADAPTER": ".core",
+    "ORDERS_ADAPTER": ".core",
+    "HEALTH_ADAPTER": ".core",
+    "ANY_WS_MESSAGE_ADAPTER": ".core",
+    "ws_message_from_json": ".core",
+    "ws_message_to_json": ".core",
+    "parse_ws_message": ".core",
+    "decode_payload": ".core",
+    "encode_tick_message": ".core",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+
+__all__ = [
+    # REST authentication
+    "UserPlan",
+    "TokenRequest",
+    "TokenResponse",
+    "UserLimitsResponse",
+    # WebSocket protocol
+    "MarketSessionPhase",
+    "ProcessingStatus",
+    "TimeInForce",
+    "ExecutionMode",
+    "ErrorType",
+    "ErrorSeverity",
+    "MARKET_SESSION_PHASES",
+    "PROCESSING_STATUSES",
+    "TIME_IN_FORCE_VALUES",
+    "EXECUTION_MODES",
+    "ERROR_TYPES",
+    "ERROR_SEVERITIES",
+    "WSMessage",
+    "PongData",
+    "HealthStatus",
+    "ConnectionReadyData",
+    "ConnectionWarningData",
+    "ConnectionClosingData",
+    "CreateSessionData",
+    "StartSimulationRequest",
+    "SessionCreatedData",
+    "SessionCreatedResponseData",
+    "SessionQueuedResponseData",
+    "SimulationStartData",
+    "SimulationStartedData",
+    "HistorySnapshotData",
+    "TickData",
+    "TickAckData",
+    "WSOrderType",
+    "OrderData",
+    "OrderBatchData",
+    "BatchAckData",
+    "ExecutionReportData",
+    "PositionData",
+    "AccountSnapshotData",
+    "build_error",
+    "ErrorData",
+    "SimulationEndData",
+    "BatchedMessagesData",
+    "TypedWSMessage",
+    "HealthMessage",
+    "PongMessage",
+    "HistorySnapshotMessage",
+    "TickMessage",
+    "TickAckMessage",
+    "OrderBatchMessage",
+    "BatchAckMessage",
+    "ExecutionReportMessage",
+    "AccountSnapshotMessage",
+    "SimulationEndMessage",
+    "BatchMessage",
+    "WS_PAYLOAD_MODELS",
+    "WS_ORDER_TYPE_BY_VALUE",
+    "AnyWSMessage",
+    "WS_MESSAGE_ADAPTER",
+    "ORDER_BATCH_ADAPTER",
+    "ORDERS_ADAPTER",
+    "HEALTH_ADAPTER",
+    "ANY_WS_MESSAGE_ADAPTER",
+    "ws_message_from_json",
+    "ws_message_to_json",
+    "parse_ws_message",
+    "decode_payload",
+    "encode_tick_message",
+]
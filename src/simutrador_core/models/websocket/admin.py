@@ -0,0 +1,55 @@
+"""
+REST authentication and account-limit models for SimuTrador.
+
+Kept apart from the WebSocket message models in ``core`` so that their schemas
+are only built by services that serve the REST endpoints.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+from ..enums import intern_enum_values
+
+# ===== ENUMS =====
+
+
+class UserPlan(str, Enum):
+    """User subscription plans with different rate limits."""
+
+    FREE = "free"
+    PROFESSIONAL = "professional"
+    ENTERPRISE = "enterprise"
+
+
+intern_enum_values(UserPlan)
+
+
+# ===== AUTHENTICATION =====
+
+
+class TokenRequest(BaseModel):
+    """REST API: Request JWT token (API key sent in header)."""
+
+    # API key sent in X-API-Key header, no body needed
+    pass
+
+
+class TokenResponse(BaseModel):
+    """REST API: JWT token response."""
+
+    access_token: str
+    expires_in: int  # Token lifetime in seconds
+    token_type: str = "Bearer"
+    user_id: str
+    plan: UserPlan
+
+
+class UserLimitsResponse(BaseModel):
+    """REST API: Current user rate limits."""
+
+    plan: UserPlan
+    limits: dict[str, int]  # Current limits
+    usage: dict[str, int]  # Current usage
+    reset_times: dict[str, datetime]  # When limits reset
@@ -0,0 +1,656 @@
+"""
+WebSocket message models for SimuTrador trading simulation.
+
+These models define the public protocol between clients and the simulation server
+as described in the WebSocket API v2 documentation. Fields are aligned with the
+examples; additional fields are optional to allow forward-compatibility.
+
+REST authentication models live in ``admin``.
+"""
+
+import sys
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Annotated, Any, Generic, Literal, Self, TypeVar, cast, get_args
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+from ...utils.epoch_time import datetime_to_ns
+from ...utils.fastjson import dumps, loads
+from ..enums import OrderSide, WSErrorCode, intern_enum_values
+from ..price_data import PriceCandle, Timeframe
+
+# ===== CHOICES =====
+
+# Literal choices shared by the payload models. Pydantic already validates string
+# literals with a hash lookup; the frozensets give callers handling raw dicts or
+# msgspec frames the same O(1) membership check.
+MarketSessionPhase = Literal["pre_market", "regular", "after_hours"]
+ProcessingStatus = Literal["ready", "processing", "need_time"]
+TimeInForce = Literal["day", "gtc", "ioc"]
+ExecutionMode = Literal["atomic", "best_effort"]
+ErrorType = Literal["validation", "execution", "connection", "data", "rate_limit"]
+ErrorSeverity = Literal["warning", "error", "fatal"]
+
+MARKET_SESSION_PHASES: frozenset[str] = frozenset(get_args(MarketSessionPhase))
+PROCESSING_STATUSES: frozenset[str] = frozenset(get_args(ProcessingStatus))
+TIME_IN_FORCE_VALUES: frozenset[str] = frozenset(get_args(TimeInForce))
+EXECUTION_MODES: frozenset[str] = frozenset(get_args(ExecutionMode))
+ERROR_TYPES: frozenset[str] = frozenset(get_args(ErrorType))
+ERROR_SEVERITIES: frozenset[str] = frozenset(get_args(ErrorSeverity))
+
+
+# ===== CORE MESSAGE ENVELOPE =====
+
+
+class WSMessage(BaseModel):
+    """Generic envelope: {"type": "...", "data": {...}, "request_id": "..."}.
+
+    Timestamp is optional (not present in all examples) and may be added by the server.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    type: str = Field(..., description="Message type")
+    data: dict[str, Any] = Field(..., description="Payload dictionary")
+    request_id: str | None = Field(
+        None, description="For request/response correlation when applicable"
+    )
+    timestamp: datetime | None = Field(None, description="Message timestamp")
+
+    @field_validator("type")
+    @classmethod
+    def _intern_type(cls, value: str) -> str:
+        """Intern the type so dispatch-table lookups compare by pointer."""
+        return sys.intern(value)
+
+    @classmethod
+    def from_json_bytes(cls, buf: str | bytes | bytearray) -> "WSMessage":
+        """Parse a raw WebSocket frame in a single pass.
+
+        Uses pydantic's native JSON parser instead of ``json.loads`` followed by
+        ``model_validate``, so no intermediate dict is materialized.
+        """
+        return cls.model_validate_json(buf)
+
+    def to_bytes(self) -> bytes:
+        """Serialize for sending (orjson when installed; Decimals as strings)."""
+        return dumps(self.model_dump())
+
+
+
+# ===== SYSTEM / PING =====
+
+
+class PongData(BaseModel):
+    """Server pong payload (mirrors current server behavior)."""
+
+    server_time: datetime
+
+# ===== HEALTH =====
+
+
+class HealthStatus(BaseModel):
+    """Standardized health status payload sent in WSMessage.data for health checks."""
+
+    status: Literal["ok", "degraded", "unhealthy"] = "ok"
+    server_time: datetime | None = None
+    server_version: str | None = None
+    message: str | None = None
+
+
+# ===== CONNECTION =====
+
+
+class ConnectionReadyData(BaseModel):
+    """Server confirms WebSocket connection and authentication."""
+
+    user_id: str
+    plan: str
+    connection_expires_at: datetime
+    idle_timeout_sec: int
+    max_simulation_duration_sec: int
+    concurrent_connections_limit: int
+    # Optional extras the server may include
+    server_time: datetime | None = None
+    supported_features: list[str] = Field(default_factory=list)
+
+
+class ConnectionWarningData(BaseModel):
+    """Server warns about impending connection closure."""
+
+    warning_type: Literal[
+        "approaching_timeout", "imminent_closure", "rate_limit_warning"
+    ]
+    message: str
+    expires_at: datetime | None = None
+    action_required: str
+    seconds_remaining: int | None = None
+
+
+class ConnectionClosingData(BaseModel):
+    """Server notifies about connection closure."""
+
+    reason: Literal[
+        "idle_timeout",
+        "max_duration",
+        "api_key_revoked",
+        "rate_limit",
+        "simulation_complete",
+        "server_maintenance",
+    ]
+    message: str
+    close_code: int
+    reconnect_allowed: bool
+    session_state: str | None = None
+
+
+# ===== SESSION MANAGEMENT =====
+
+
+class CreateSessionData(BaseModel):
+    """Client: Create new simulation session."""
+
+    session_id: str
+    symbols: list[str]
+    start: datetime
+    end: datetime
+    data_provider: str = Field(default="polygon")
+    initial_cash: Decimal
+
+
+
+class StartSimulationRequest(BaseModel):
+    """Client: Start simulation request matching server API.
+
+    Adds explicit timeframe and warmup controls, preserving existing fields.
+    """
+
+    symbols: list[str] = Field(..., min_length=1)
+    start_date: datetime
+    end_date: datetime
+    initial_capital: Decimal
+
+    # New required parameters
+    timeframe: Timeframe = Field(
+        ..., description="Candle resolution for the session (e.g., 1min, 5min, daily)"
+    )
+    warmup_bars: int = Field(
+        ..., ge=0, description="Number of historical candles to warm up per symbol"
+    )
+    adjusted: bool = Field(
+        default=True, description="Use adjusted prices when available"
+    )
+
+    # Existing optional parameters
+    data_provider: str | None = None
+    commission_per_share: Decimal | None = None
+    slippage_bps: int | None = None
+    metadata: dict[str, Any] | None = None
+
+    @model_validator(mode="after")
+    def _check_date_range(self) -> Self:
+        """Validate date range coherent (non-empty symbols is enforced by the field)."""
+        if self.start_date >= self.end_date:
+            raise ValueError("start_date must be earlier than end_date")
+        return self
+
+
+class SessionCreatedData(BaseModel):
+    """Server: Session creation confirmation."""
+
+    session_id: str
+    estimated_ticks: int
+    symbols_loaded: list[str]
+    # Optional extras
+    data_range_actual: dict[str, Any] | None = None
+    server_ready: bool | None = None
+
+
+# ===== SESSION CREATED (SERVER RESPONSES) =====
+
+
+class SessionCreatedResponseData(BaseModel):
+    """Server: session_created payload (created or ready state).
+
+    Mirrors current server shape; dates are datetimes and Decimals are numeric when
+    dumped via model_dump(mode="json"), matching the server's existing behavior.
+    """
+
+    session_id: str
+    status: Literal["created"] = "created"
+    symbols: list[str]
+    start_date: datetime
+    end_date: datetime
+    initial_capital: Decimal
+    state: str
+    created_at: datetime
+    data_provider: str
+    commission_per_share: Decimal
+    slippage_bps: int | None = None
+
+
+class SessionQueuedResponseData(SessionCreatedResponseData):
+    """Server: session_created payload when queued.
+
+    Extends SessionCreatedResponseData with queue_position.
+    """
+
+    queue_position: int
+
+
+# ===== SIMULATION CONTROL =====
+
+
+class SimulationStartData(BaseModel):
+    """Client requests simulation start."""
+
+    flow_control: bool = True
+    max_pending_ticks: int = 1
+
+
+class SimulationStartedData(BaseModel):
+    """Server confirms simulation has begun."""
+
+    session_id: str
+    started_at: datetime
+    flow_control_enabled: bool
+    # Optional extras
+    estimated_duration_sec: int | None = None
+    tick_interval_ms: int | None = None
+
+
+
+# ===== HISTORY SNAPSHOT =====
+
+
+class HistorySnapshotData(BaseModel):
+    """Server-emitted history snapshot sent once before ticks (type = 'history_snapshot')."""
+
+    session_id: str
+    timeframe: Timeframe
+    candles: dict[str, list[PriceCandle]]
+    start: datetime | None = None
+    end: datetime | None = None
+    count: int
+
+
+class TickData(BaseModel):
+    """Server advances simulation time.
+
+    Now includes per-tick candlestick data for one or more symbols.
+    The server SHOULD populate the `candles` field on every tick.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    sim_time: datetime
+    sequence_id: int
+
+    # New fields for candlestick delivery
+    timeframe: Timeframe | None = Field(
+        default=None, description="Timeframe of the emitted candles (e.g., 1min, 5min)"
+    )
+    candles: dict[str, PriceCandle] | None = Field(
+        default=None,
+        description="Mapping of symbol -> OHLCV candle for this tick",
+    )
+
+    # Optional extras
+    market_session: MarketSessionPhase | None = None
+    symbols_trading: list[str] | None = None
+    is_eod: bool = False
+
+    @property
+    def sim_time_ns(self) -> int:
+        """``sim_time`` as epoch nanoseconds (naive values are taken as UTC)."""
+        return datetime_to_ns(self.sim_time)
+
+
+class TickAckData(BaseModel):
+    """Client acknowledges tick and signals readiness."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    sequence_id: int
+    processing_status: ProcessingStatus
+    orders_pending: int = 0
+    max_wait_ms: int = 1000
+
+
+# ===== ORDER MANAGEMENT =====
+
+
+class WSOrderType(str, Enum):
+    MARKET = "market"
+    LIMIT = "limit"
+    STOP = "stop"
+    STOP_LIMIT = "stop_limit"
+
+
+intern_enum_values(WSOrderType)
+
+# Value -> member lookup for resolving wire strings outside of pydantic validation
+WS_ORDER_TYPE_BY_VALUE: dict[str, WSOrderType] = {m.value: m for m in WSOrderType}
+
+# Order types that carry a limit price; membership is a C-level hash probe.
+_LIMIT_PRICED_TYPES: frozenset[WSOrderType] = frozenset(
+    {WSOrderType.LIMIT, WSOrderType.STOP_LIMIT}
+)
+
+
+class OrderData(BaseModel):
+    """Individual order within a batch.
+
+    Brackets: when provided on an entry order, stop_loss/take_profit act as an
+    attached bracket; the server manages OCO child orders internally.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    type: WSOrderType
+    quantity: int = Field(gt=0)
+    price: Decimal | None = Field(default=None, gt=0)  # Limit price (for limit/stop_limit)
+    stop_loss: Decimal | None = Field(default=None, gt=0)
+    take_profit: Decimal | None = Field(default=None, gt=0)
+    time_in_force: TimeInForce = "day"
+
+    @property
+    def requires_price(self) -> bool:
+        """Whether this order type needs a limit ``price`` (limit/stop_limit)."""
+        return self.type in _LIMIT_PRICED_TYPES
+
+
+class OrderBatchData(BaseModel):
+    """Client submits batch of orders."""
+
+    batch_id: str
+    orders: list[OrderData]
+    execution_mode: ExecutionMode = "best_effort"
+    parent_strategy: str | None = None
+
+    @classmethod
+    def from_json_bytes(cls, buf: str | bytes | bytearray) -> "OrderBatchData":
+        """Parse a raw order batch payload in a single pass (no ``json.loads``)."""
+        return cls.model_validate_json(buf)
+
+
+class BatchAckData(BaseModel):
+    """Server acknowledges order batch."""
+
+    batch_id: str
+    accepted_orders: list[str]
+    rejected_orders: dict[str, str]
+    estimated_fills: dict[str, Decimal]
+
+
+class ExecutionReportData(BaseModel):
+    """Server reports order execution."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    execution_id: str
+    order_id: str
+    symbol: str
+    executed_quantity: int = Field(gt=0)
+    executed_price: Decimal = Field(gt=0)
+    commission: Decimal
+    slippage_bps: int
+    timestamp: datetime | None = None
+
+    @property
+    def timestamp_ns(self) -> int | None:
+        """``timestamp`` as epoch nanoseconds, if set (naive values are taken as UTC)."""
+        return None if self.timestamp is None else datetime_to_ns(self.timestamp)
+
+
+# ===== ACCOUNT & PORTFOLIO =====
+
+
+class PositionData(BaseModel):
+    symbol: str
+    quantity: int
+    avg_cost: Decimal
+
+
+class AccountSnapshotData(BaseModel):
+    cash: Decimal
+    equity: Decimal
+    positions: list[PositionData]
+    # Optional extras
+    buying_power: Decimal | None = None
+    day_pnl: Decimal | None = None
+    open_orders: list[str] | None = None
+
+
+# ===== ERROR HANDLING =====
+
+
+
+
+def build_error(
+    code: WSErrorCode | str,
+    message: str,
+    details: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build a standardized error payload for WSMessage.data.
+
+    This preserves the existing public shape used by the server:
+    {"error_code": "...", "message": "...", "details": {...}}
+    """
+
+    payload: dict[str, Any] = {"error_code": str(code), "message": message}
+    if details:
+        payload["details"] = details
+    return payload
+
+class ErrorData(BaseModel):
+    error_code: str
+    message: str
+    error_type: ErrorType
+    severity: ErrorSeverity
+    recoverable: bool
+    details: dict[str, Any] | None = None
+
+
+# ===== SIMULATION COMPLETION =====
+
+
+class SimulationEndData(BaseModel):
+    session_id: str
+    final_equity: Decimal
+    total_trades: int
+    sharpe_ratio: Decimal | None = None
+    # Optional extras
+    total_return_pct: Decimal | None = None
+    win_rate: Decimal | None = None
+    max_drawdown_pct: Decimal | None = None
+    simulation_duration_sec: int | None = None
+
+
+# ===== BATCHING =====
+
+
+class BatchedMessagesData(BaseModel):
+    """Several messages coalesced into one ``batch`` frame, in send order.
+
+    Inner messages are parsed like top-level frames: typed envelopes for known
+    types, ``WSMessage`` otherwise.
+    """
+
+    messages: list["AnyWSMessage"]
+
+
+# ===== TYPED ENVELOPES =====
+
+TypeT = TypeVar("TypeT", bound=str)
+DataT = TypeVar("DataT", bound=BaseModel)
+
+
+class TypedWSMessage(BaseModel, Generic[TypeT, DataT]):
+    """Envelope whose ``data`` is validated as a concrete payload model.
+
+    Parametrize with the literal type tag and payload, e.g.
+    ``TypedWSMessage[Literal["tick"], TickData]``.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    type: TypeT = Field(..., description="Message type")
+    data: DataT = Field(..., description="Typed payload")
+    request_id: str | None = Field(
+        None, description="For request/response correlation when applicable"
+    )
+    timestamp: datetime | None = Field(None, description="Message timestamp")
+
+
+HealthMessage = TypedWSMessage[Literal["health"], HealthStatus]
+PongMessage = TypedWSMessage[Literal["pong"], PongData]
+HistorySnapshotMessage = TypedWSMessage[Literal["history_snapshot"], HistorySnapshotData]
+TickMessage = TypedWSMessage[Literal["tick"], TickData]
+TickAckMessage = TypedWSMessage[Literal["tick_ack"], TickAckData]
+OrderBatchMessage = TypedWSMessage[Literal["order_batch"], OrderBatchData]
+BatchAckMessage = TypedWSMessage[Literal["batch_ack"], BatchAckData]
+ExecutionReportMessage = TypedWSMessage[Literal["execution_report"], ExecutionReportData]
+AccountSnapshotMessage = TypedWSMessage[Literal["account_snapshot"], AccountSnapshotData]
+SimulationEndMessage = TypedWSMessage[Literal["simulation_end"], SimulationEndData]
+BatchMessage = TypedWSMessage[Literal["batch"], BatchedMessagesData]
+
+# Message type -> payload model for every typed envelope above
+WS_PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
+    "health": HealthStatus,
+    "pong": PongData,
+    "history_snapshot": HistorySnapshotData,
+    "tick": TickData,
+    "tick_ack": TickAckData,
+    "order_batch": OrderBatchData,
+    "batch_ack": BatchAckData,
+    "execution_report": ExecutionReportData,
+    "account_snapshot": AccountSnapshotData,
+    "simulation_end": SimulationEndData,
+    "batch": BatchedMessagesData,
+}
+
+# Any inbound message: the typed envelope for known types, WSMessage otherwise.
+# Envelope and payload are validated in a single pass (see parse_ws_message).
+_GENERIC_TAG = "*"
+
+
+def _message_tag(value: Any) -> str:
+    """Pick the union member by ``type``; unknown types use the generic WSMessage.
+
+    Non-string tags (malformed client input) also go to WSMessage, whose ``type``
+    validation rejects them with a ValidationError.
+    """
+    if isinstance(value, dict):
+        message_type = cast(dict[str, Any], value).get("type")
+    else:
+        message_type = getattr(value, "type", None)
+    if isinstance(message_type, str) and message_type in WS_PAYLOAD_MODELS:
+        return message_type
+    return _GENERIC_TAG
+
+
+AnyWSMessage = Annotated[
+    Annotated[HealthMessage, Tag("health")]
+    | Annotated[PongMessage, Tag("pong")]
+    | Annotated[HistorySnapshotMessage, Tag("history_snapshot")]
+    | Annotated[TickMessage, Tag("tick")]
+    | Annotated[TickAckMessage, Tag("tick_ack")]
+    | Annotated[OrderBatchMessage, Tag("order_batch")]
+    | Annotated[BatchAckMessage, Tag("batch_ack")]
+    | Annotated[ExecutionReportMessage, Tag("execution_report")]
+    | Annotated[AccountSnapshotMessage, Tag("account_snapshot")]
+    | Annotated[SimulationEndMessage, Tag("simulation_end")]
+    | Annotated[BatchMessage, Tag("batch")]
+    | Annotated[WSMessage, Tag(_GENERIC_TAG)],
+    Discriminator(_message_tag),
+]
+
+# Resolve the forward reference to the union (batches may nest any message)
+BatchedMessagesData.model_rebuild()
+
+
+# ===== CACHED ADAPTERS =====
+
+# Built once at import so call sites reuse the compiled validator/serializer and
+# can bind the methods directly (e.g. ``ws_message_from_json(raw)``).
+WS_MESSAGE_ADAPTER: TypeAdapter[WSMessage] = TypeAdapter(WSMessage)
+ORDER_BATCH_ADAPTER: TypeAdapter[OrderBatchData] = TypeAdapter(OrderBatchData)
+ORDERS_ADAPTER: TypeAdapter[list[OrderData]] = TypeAdapter(list[OrderData])
+HEALTH_ADAPTER: TypeAdapter[HealthStatus] = TypeAdapter(HealthStatus)
+ANY_WS_MESSAGE_ADAPTER: TypeAdapter[AnyWSMessage] = TypeAdapter(AnyWSMessage)
+
+ws_message_from_json = WS_MESSAGE_ADAPTER.validate_json
+ws_message_to_json = WS_MESSAGE_ADAPTER.dump_json
+parse_ws_message = ANY_WS_MESSAGE_ADAPTER.validate_json
+
+# Message type -> payload adapter, for decoding data without the envelope model
+_PAYLOAD_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    message_type: TypeAdapter(model) for message_type, model in WS_PAYLOAD_MODELS.items()
+}
+
+
+def decode_payload(raw: str | bytes | bytearray) -> tuple[str, BaseModel | dict[str, Any]]:
+    """Decode a frame into its type and validated payload, skipping the envelope model.
+
+    Payloads of types without a registered model (see ``WS_PAYLOAD_MODELS``)
+    are returned as the raw dict. Raises ``ValueError`` if the frame is not a
+    JSON object with a string ``type`` and a ``data`` field (payload validation
+    errors are ``pydantic.ValidationError``, itself a ``ValueError``).
+    """
+    decoded = loads(raw)
+    if not isinstance(decoded, dict):
+        raise ValueError("WebSocket frame is not a JSON object")
+    envelope = cast(dict[str, Any], decoded)
+    message_type = envelope.get("type")
+    if not isinstance(message_type, str):
+        raise ValueError("WebSocket frame has no string 'type'")
+    if "data" not in envelope:
+        raise ValueError("WebSocket frame has no 'data'")
+    adapter = _PAYLOAD_ADAPTERS.get(message_type)
+    data = envelope["data"]
+    return message_type, data if adapter is None else adapter.validate_python(data)
+
+
+# ===== FAST ENCODERS =====
+
+# Fixed layout of a plain tick frame; only the values are filled in per tick
+_TICK_TEMPLATE = (
+    b'{"type":"tick","data":{"sim_time":%b,"sequence_id":%d,"timeframe":%b,"candles":%b}}'
+)
+
+
+def encode_tick_message(tick: TickData) -> bytes:
+    """Encode a ``tick`` frame without building an envelope model.
+
+    Ticks carrying only the core fields (time, sequence, timeframe, candles)
+    are written into a precomputed byte template; ticks with any of the optional
+    extras set fall back to the generic encoder. The output matches
+    ``WSMessage(type="tick", data=tick.model_dump()).to_bytes()`` except that
+    unset envelope fields (and, on the template path, the default-valued
+    extras) are omitted.
+    """
+    if tick.market_session is not None or tick.symbols_trading is not None or tick.is_eod:
+        return dumps({"type": "tick", "data": tick.model_dump()})
+    return _TICK_TEMPLATE % (
+        dumps(tick.sim_time),
+        tick.sequence_id,
+        b"null" if tick.timeframe is None else dumps(tick.timeframe.value),
+        b"null"
+        if tick.candles is None
+        else dumps({symbol: candle.model_dump() for symbol, candle in tick.candles.items()}),
+    )
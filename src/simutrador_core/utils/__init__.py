@@ -2,22 +2,82 @@
 SimuTrador Core Utilities
 
 Shared utility functions used across all SimuTrador components.
+
+Submodules are imported lazily (PEP 562): e.g. the timeframe and logging helpers
+are only loaded when one of their names is first accessed from this package.
 """
 
-# Import all utility functions for re-export
-
-from .logging_utils import (
-    configure_third_party_loggers,
-    get_default_logger,
-    setup_logger,
-)
-from .timeframe_utils import (
-    get_pandas_frequency,
-    get_resampling_rules,
-    get_supported_timeframes,
-    get_timeframe_minutes,
-    validate_timeframe_conversion,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .batched_sender import RECORD_SEPARATOR, BatchedSender, drain_and_send
+    from .epoch_time import NS_PER_SECOND, datetime_to_ns, ns_to_datetime
+    from .event_loop import run_async
+    from .fastjson import dumps, encode_envelope, loads, raw_json
+    from .fixed_point import PRICE_DECIMALS, PRICE_SCALE, from_minor_units, to_minor_units
+    from .json_schema import cached_json_schema
+    from .logging_utils import (
+        CONSOLE_FMT,
+        FILE_FMT,
+        configure_third_party_loggers,
+        get_default_logger,
+        setup_logger,
+    )
+    from .timeframe_utils import (
+        get_pandas_frequency,
+        get_resampling_rules,
+        get_supported_timeframes,
+        get_timeframe_minutes,
+        validate_timeframe_conversion,
+    )
+    from .ws_dispatch import HANDLERS, dispatch, ws_handler
+
+# Public name -> submodule defining it (attribute name == public name)
+_EXPORTS: dict[str, str] = {
+    # Timeframe utilities
+    "get_timeframe_minutes": ".timeframe_utils",
+    "get_pandas_frequency": ".timeframe_utils",
+    "validate_timeframe_conversion": ".timeframe_utils",
+    "get_supported_timeframes": ".timeframe_utils",
+    "get_resampling_rules": ".timeframe_utils",
+    # Logging utilities
+    "setup_logger": ".logging_utils",
+    "get_default_logger": ".logging_utils",
+    "configure_third_party_loggers": ".logging_utils",
+    "CONSOLE_FMT": ".logging_utils",
+    "FILE_FMT": ".logging_utils",
+    # JSON serialization
+    "dumps": ".fastjson",
+    "loads": ".fastjson",
+    "encode_envelope": ".fastjson",
+    "raw_json": ".fastjson",
+    # JSON Schema
+    "cached_json_schema": ".json_schema",
+    # WebSocket send batching
+    "BatchedSender": ".batched_sender",
+    "RECORD_SEPARATOR": ".batched_sender",
+    "drain_and_send": ".batched_sender",
+    # WebSocket dispatch
+    "HANDLERS": ".ws_dispatch",
+    "ws_handler": ".ws_dispatch",
+    "dispatch": ".ws_dispatch",
+    # Event loop
+    "run_async": ".event_loop",
+    # Fixed-point prices
+    "PRICE_DECIMALS": ".fixed_point",
+    "PRICE_SCALE": ".fixed_point",
+    "to_minor_units": ".fixed_point",
+    "from_minor_units": ".fixed_point",
+    # Epoch-nanosecond timestamps
+    "NS_PER_SECOND": ".epoch_time",
+    "datetime_to_ns": ".epoch_time",
+    "ns_to_datetime": ".epoch_time",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
 
 __all__ = [
     # Timeframe utilities
@@ -30,4 +90,32 @@ __all__ = [
     "setup_logger",
     "get_default_logger",
     "configure_third_party_loggers",
+    "CONSOLE_FMT",
+    "FILE_FMT",
+    # JSON serialization
+    "dumps",
+    "loads",
+    "encode_envelope",
+    "raw_json",
+    # JSON Schema
+    "cached_json_schema",
+    # WebSocket send batching
+    "BatchedSender",
+    "RECORD_SEPARATOR",
+    "drain_and_send",
+    # WebSocket dispatch
+    "HANDLERS",
+    "ws_handler",
+    "dispatch",
+    # Event loop
+    "run_async",
+    # Fixed-point prices
+    "PRICE_DECIMALS",
+    "PRICE_SCALE",
+    "to_minor_units",
+    "from_minor_units",
+    # Epoch-nanosecond timestamps
+    "NS_PER_SECOND",
+    "datetime_to_ns",
+    "ns_to_datetime",
 ]
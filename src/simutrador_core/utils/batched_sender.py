@@ -0,0 +1,170 @@
+"""
+Outbound WebSocket message batching.
+
+Per-message ``await ws.send()`` pays frame construction and a buffer drain for
+every message. ``BatchedSender`` queues encoded messages and a single background
+writer coalesces whatever is pending into one frame, with messages separated by
+the ASCII record separator (``RECORD_SEPARATOR``). Receivers split incoming frames
+on that byte.
+
+``drain_and_send`` is the JSON-native alternative: it wraps pending encoded
+messages in a single ``{"type": "batch", "data": {"messages": [...]}}`` envelope
+(see ``BatchedMessagesData``), so receivers need no framing beyond JSON.
+"""
+
+import asyncio
+import contextlib
+from typing import Protocol
+
+RECORD_SEPARATOR = b"\x1e"
+
+_BATCH_PREFIX = b'{"type":"batch","data":{"messages":['
+_BATCH_SUFFIX = b"]}}"
+
+
+class FrameSink(Protocol):
+    """Anything with an async ``send`` (e.g. a ``websockets`` connection)."""
+
+    async def send(self, message: bytes, /) -> None: ...
+
+
+class BatchedSender:
+    """
+    Coalesce outbound messages into record-separated frames.
+
+    A batch is flushed when it reaches ``max_batch`` messages, ``max_bytes`` bytes,
+    or when no further message arrives within ``flush_ms`` of the first one.
+
+    Usage:
+        sender = BatchedSender(ws)
+        sender.start()
+        sender.send(payload_bytes)
+        ...
+        await sender.close()
+    """
+
+    def __init__(
+        self,
+        ws: FrameSink,
+        max_batch: int = 100,
+        max_bytes: int = 64 << 10,
+        flush_ms: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            ws: Connection used to send the coalesced frames
+            max_batch: Maximum number of messages per frame
+            max_bytes: Size budget per frame (the message crossing it is still included)
+            flush_ms: How long to wait for more messages after the first one
+        """
+        self._ws = ws
+        self._max_batch = max_batch
+        self._max_bytes = max_bytes
+        self._flush_s = flush_ms / 1000
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background writer on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def send(self, message: bytes) -> None:
+        """Queue an encoded message for sending (never blocks).
+
+        Raises ``RuntimeError`` before ``start()``, after ``close()`` or once the
+        writer has stopped, and re-raises the writer's exception if sending
+        failed, so messages are never queued for a writer that is not running.
+        """
+        task = self._task
+        if task is None:
+            raise RuntimeError("BatchedSender is not running; call start() first")
+        if task.done():
+            exc = None if task.cancelled() else task.exception()
+            if exc is not None:
+                raise exc
+            raise RuntimeError("BatchedSender writer has stopped")
+        self._queue.put_nowait(message)
+
+    async def close(self) -> None:
+        """Flush pending messages and stop the background writer.
+
+        Re-raises the writer's exception if sending failed.
+        """
+        task = self._task
+        if task is None:
+            return
+        self._task = None
+        drained = asyncio.ensure_future(self._queue.join())
+        await asyncio.wait({drained, task}, return_when=asyncio.FIRST_COMPLETED)
+        drained.cancel()
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            message = await queue.get()
+            batch = [message]
+            size = len(message)
+            deadline = loop.time() + self._flush_s
+            while len(batch) < self._max_batch and size < self._max_bytes:
+                try:
+                    message = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        message = await asyncio.wait_for(queue.get(), remaining)
+                    except TimeoutError:
+                        break
+                batch.append(message)
+                size += len(message)
+            try:
+                await self._ws.send(batch[0] if len(batch) == 1 else RECORD_SEPARATOR.join(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+
+async def drain_and_send(
+    queue: asyncio.Queue[bytes], ws: FrameSink, max_bytes: int = 64 << 10
+) -> int:
+    """
+    Wait for one encoded message, then send it with everything already pending.
+
+    Pending messages are drained without waiting until ``max_bytes`` is reached
+    (the message crossing it is still included). Several messages go out as one
+    ``batch`` frame; a lone message is sent unchanged. Call in a loop from the
+    connection's writer task.
+
+    Args:
+        queue: Queue of encoded WSMessage JSON frames
+        ws: Connection used to send the frame
+        max_bytes: Size budget per frame
+
+    Returns:
+        Number of messages sent
+    """
+    message = await queue.get()
+    batch = [message]
+    size = len(message)
+    while size < max_bytes:
+        try:
+            message = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        batch.append(message)
+        size += len(message)
+    try:
+        if len(batch) == 1:
+            await ws.send(batch[0])
+        else:
+            await ws.send(_BATCH_PREFIX + b",".join(batch) + _BATCH_SUFFIX)
+    finally:
+        for _ in batch:
+            queue.task_done()
+    return len(batch)
@@ -0,0 +1,46 @@
+"""
+Integer epoch-nanosecond timestamps.
+
+Simulation clocks compare and advance faster as plain ``int`` nanoseconds since
+the Unix epoch than as ``datetime`` objects. Convert at the boundary with these
+helpers; the public models keep their ``datetime`` fields and expose ``*_ns``
+properties (e.g. ``TickData.sim_time_ns``).
+
+Conversions use integer arithmetic only, so they are exact to the microsecond
+(``datetime``'s resolution). Naive datetimes are taken to be UTC.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+NS_PER_SECOND = 1_000_000_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """
+    Convert a datetime to nanoseconds since the Unix epoch.
+
+    Args:
+        value: Timestamp to convert (naive values are treated as UTC)
+
+    Returns:
+        Epoch nanoseconds
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND * 1000
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """
+    Convert nanoseconds since the Unix epoch to a UTC datetime.
+
+    Args:
+        ns: Epoch nanoseconds (sub-microsecond digits are floored)
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return _EPOCH + timedelta(microseconds=ns // 1000)
@@ -0,0 +1,36 @@
+"""
+Event loop helpers for SimuTrador runners and WebSocket clients.
+
+uvloop roughly doubles WebSocket send/receive throughput compared to the stock
+asyncio loop. It is used automatically when installed (``simutrador-core[fast]``,
+not available on Windows) and the stock loop is used otherwise.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_async(main: Coroutine[Any, Any, T], *, debug: bool | None = None) -> T:
+    """
+    Drop-in replacement for ``asyncio.run`` that prefers uvloop.
+
+    Args:
+        main: Coroutine to run to completion
+        debug: Event loop debug mode (None keeps the asyncio default)
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(debug=debug, loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
@@ -0,0 +1,174 @@
+"""
+Fast JSON helpers for the WebSocket read and write paths.
+
+Uses orjson when it is installed (``pip install simutrador-core[fast]``) and
+falls back to the standard library ``json`` module otherwise; both backends
+produce the same compact output.
+
+Serialization rules:
+- Pydantic models are dumped with ``model_dump(mode="json")``
+- ``Decimal`` values are written as JSON strings to preserve precision
+- UTC datetimes end in ``Z`` (as in Pydantic's JSON mode), whether they are
+  top-level values or nested inside models
+- Sets and frozensets are written as arrays
+
+``encode_envelope`` writes outbound ``{"type", "data", ...}`` frames directly,
+without building and re-validating a ``WSMessage``. ``raw_json`` marks an
+already-encoded JSON blob for verbatim embedding in such frames.
+"""
+
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, cast
+from uuid import UUID
+
+from pydantic import BaseModel
+
+_ZERO = timedelta(0)
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types the JSON backend does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, set | frozenset):
+        return list(cast(set[Any] | frozenset[Any], obj))
+    # Handled natively by orjson; needed for the stdlib fallback only
+    if isinstance(obj, datetime) and obj.utcoffset() == _ZERO:
+        return obj.isoformat().removesuffix("+00:00") + "Z"
+    if isinstance(obj, datetime | date | time):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object (or Pydantic model) to compact JSON bytes.
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_UTC_Z)
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """
+        Parse JSON directly from a raw frame (no separate UTF-8 decode pass).
+
+        Args:
+            data: JSON document as bytes or text
+
+        Returns:
+            Parsed Python object
+        """
+        return orjson.loads(data)
+
+    def raw_json(data: bytes | str) -> Any:
+        """
+        Wrap already-encoded JSON so ``dumps`` embeds it verbatim (no parse).
+
+        The result is an ``orjson.Fragment``. Only place it in objects passed
+        straight to ``dumps``/``encode_envelope`` (e.g. error details
+        forwarded from another service), never in model fields or payload
+        dicts that may reach Pydantic: ``model_dump_json`` cannot encode it.
+
+        Args:
+            data: A complete JSON document
+
+        Returns:
+            Opaque value serialized as ``data``
+        """
+        return orjson.Fragment(data)
+
+except ImportError:  # pragma: no cover - depends on installed extras
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object (or Pydantic model) to compact JSON bytes.
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """
+        Parse JSON directly from a raw frame (no separate UTF-8 decode pass).
+
+        Args:
+            data: JSON document as bytes or text
+
+        Returns:
+            Parsed Python object
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def raw_json(data: bytes | str) -> Any:
+        """
+        Wrap already-encoded JSON so ``dumps`` embeds it verbatim (no parse).
+
+        Without orjson the document is parsed here and re-encoded by ``dumps``,
+        which produces equivalent JSON.
+
+        Args:
+            data: A complete JSON document
+
+        Returns:
+            Value serialized as ``data``
+        """
+        return json.loads(data)
+
+
+@lru_cache(maxsize=64)
+def _envelope_prefix(message_type: str) -> bytes:
+    """Encoded ``{"type":...,"data":`` head for a message type (one per type)."""
+    return b'{"type":' + dumps(message_type) + b',"data":'
+
+
+def encode_envelope(
+    message_type: str,
+    data: Any,
+    request_id: str | None = None,
+    timestamp: datetime | None = None,
+) -> bytes:
+    """
+    Encode an outbound WSMessage frame without constructing the model.
+
+    The payload was generated by the caller, so the envelope is not
+    validated; unset optional fields are omitted.
+
+    Args:
+        message_type: WSMessage.type value (e.g., 'tick', 'execution_report')
+        data: Payload object or model, or ``bytes`` already encoded as JSON
+        request_id: Optional request/response correlation id
+        timestamp: Optional message timestamp
+
+    Returns:
+        UTF-8 encoded JSON frame
+    """
+    parts = [_envelope_prefix(message_type), data if isinstance(data, bytes) else dumps(data)]
+    if request_id is not None:
+        parts += (b',"request_id":', dumps(request_id))
+    if timestamp is not None:
+        parts += (b',"timestamp":', dumps(timestamp))
+    parts.append(b"}")
+    return b"".join(parts)
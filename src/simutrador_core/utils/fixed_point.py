@@ -0,0 +1,42 @@
+"""
+Fixed-point (integer minor-unit) helpers for prices and quantities.
+
+Hot numeric loops (PnL, fills, bracket checks) can keep prices as plain ``int``
+minor units instead of ``Decimal``: integer arithmetic is much cheaper and
+serializes natively with orjson/msgspec. Convert at the boundary with these
+helpers; the public WebSocket models keep ``Decimal`` fields.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+# 8 decimal places covers equity cents and crypto precision alike
+PRICE_DECIMALS = 8
+PRICE_SCALE = 10**PRICE_DECIMALS
+
+
+def to_minor_units(value: Decimal | int | str, decimals: int = PRICE_DECIMALS) -> int:
+    """
+    Convert a decimal amount to integer minor units.
+
+    Args:
+        value: Amount to convert (floats should be passed as ``str(value)``)
+        decimals: Number of decimal places represented by one unit
+
+    Returns:
+        Amount scaled by ``10**decimals``, rounded half-to-even
+    """
+    return int(Decimal(value).scaleb(decimals).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def from_minor_units(units: int, decimals: int = PRICE_DECIMALS) -> Decimal:
+    """
+    Convert integer minor units back to a Decimal amount.
+
+    Args:
+        units: Scaled integer amount
+        decimals: Number of decimal places represented by one unit
+
+    Returns:
+        Exact Decimal value of ``units / 10**decimals``
+    """
+    return Decimal(units).scaleb(-decimals)
@@ -0,0 +1,33 @@
+"""
+Memoized JSON Schema generation for Pydantic models.
+
+``Model.model_json_schema()`` regenerates the schema on every call. Components
+that publish or validate against the protocol schemas (e.g. per connection or
+per request) should use ``cached_json_schema`` instead.
+"""
+
+from functools import cache
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+
+@cache
+def cached_json_schema(
+    model: type[BaseModel],
+    mode: Literal["validation", "serialization"] = "validation",
+) -> dict[str, Any]:
+    """
+    Return the JSON Schema of a model, generated once per (model, mode).
+
+    The returned dict is shared between callers: do not mutate it (copy it
+    first with ``copy.deepcopy`` if it needs changes).
+
+    Args:
+        model: Pydantic model class
+        mode: Whether to describe the validation (input) or serialization (output) shape
+
+    Returns:
+        JSON Schema dictionary
+    """
+    return model.model_json_schema(mode=mode)
@@ -3,11 +3,67 @@ Logging utilities for SimuTrador components.
 
 This module provides standardized logging configuration that can be used
 across all SimuTrador components for consistent logging behavior.
+
+File output goes through a queue: the logging call only enqueues the record and
+a background ``QueueListener`` thread performs the file writes and rotation.
+Threads do not survive ``os.fork()``, so forked workers (e.g. gunicorn
+``--preload``) get a fresh queue and listener for every file logger.
+
+On hot paths, pass arguments instead of pre-formatted strings
+(``logger.debug("tick %d", seq)``) and guard expensive argument construction
+with ``if logger.isEnabledFor(logging.DEBUG):``.
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
+
+# Console records are frequent: no caller location in the output
+CONSOLE_FMT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# File records are errors by default, so the caller location is affordable
+FILE_FMT = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+
+# Formatters are stateless; build once and share across loggers
+_CONSOLE_FORMATTER = logging.Formatter(CONSOLE_FMT)
+_FILE_FORMATTER = logging.Formatter(FILE_FMT)
+
+# Logger name -> (handler enqueueing its records, background listener writing its log file)
+_LISTENERS: dict[str, tuple[QueueHandler, QueueListener]] = {}
+
+
+def _start_listener(queue_handler: QueueHandler, *handlers: logging.Handler) -> QueueListener:
+    """Point ``queue_handler`` at a fresh queue and start a listener draining it."""
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    queue_handler.queue = log_queue
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _stop_listeners() -> None:
+    """Flush and stop all file listeners (registered with atexit)."""
+    for _, listener in _LISTENERS.values():
+        listener.stop()
+    _LISTENERS.clear()
+
+
+def _restart_listeners_in_child() -> None:
+    """Give a forked child its own queues and listener threads.
+
+    The parent's listener threads do not exist in the child, and records still
+    queued at fork time belong to the parent, so both are replaced, not reused.
+    """
+    for name, (queue_handler, listener) in _LISTENERS.items():
+        _LISTENERS[name] = (queue_handler, _start_listener(queue_handler, *listener.handlers))
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_in_child)
 
 
 def setup_logger(
@@ -44,10 +100,7 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
-    console_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
     # File handler (if log_dir is specified)
@@ -59,15 +112,24 @@ def setup_logger(
             backupCount=backup_count,
         )
         file_handler.setLevel(file_level)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        # Enqueue only records the file handler would write
+        queue_handler = QueueHandler(SimpleQueue())
+        queue_handler.setLevel(file_level)
+        # The logger's handlers were removed since its last setup: retire the old thread
+        previous = _LISTENERS.pop(name, None)
+        if previous is not None:
+            previous[1].stop()
+            for handler in previous[1].handlers:
+                handler.close()
+        _LISTENERS[name] = (queue_handler, _start_listener(queue_handler, file_handler))
+        logger.addHandler(queue_handler)
 
     return logger
 
 
+@cache
 def get_default_logger(component_name: str) -> logging.Logger:
     """
     Get a default logger for a SimuTrador component.
@@ -77,6 +139,10 @@ def get_default_logger(component_name: str) -> logging.Logger:
     - ERROR level file logging to ./logs directory
     - Rotating file handler with 5MB max size
 
+    The result is memoized per component, so repeated calls skip the working
+    directory lookup; ./logs is resolved against the working directory of the
+    first call.
+
     Args:
         component_name: Name of the component (e.g., 'data_manager', 'simulator')
 
@@ -97,9 +163,16 @@ def configure_third_party_loggers(level: int = logging.WARNING) -> None:
     """
     Configure third-party library loggers to reduce noise.
 
+    Also stops recording thread, process and multiprocessing details on log
+    records: none of the SimuTrador formats use them.
+
     Args:
         level: Log level to set for third-party loggers
     """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Common noisy loggers
     noisy_loggers = [
         "uvicorn.access",
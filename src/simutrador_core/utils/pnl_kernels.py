@@ -0,0 +1,86 @@
+"""
+Vectorized mark-to-market kernels over struct-of-arrays position data.
+
+Positions are held as parallel NumPy arrays (quantity, average cost, last
+price) and updated in place every tick. When numba is installed
+(``pip install simutrador-core[jit]``) the kernel is JIT-compiled, with the
+compiled code cached on disk so later imports skip compilation. Otherwise an
+equivalent NumPy implementation is used.
+
+Results are float64 and meant for per-tick analytics; exact ``Decimal``
+accounting remains the job of the Pydantic models.
+"""
+
+from collections.abc import Callable
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+QtyArray = npt.NDArray[np.int64]
+PriceArray = npt.NDArray[np.float64]
+
+MarkToMarket = Callable[[QtyArray, PriceArray, PriceArray, PriceArray, PriceArray], None]
+
+
+def _mark_to_market_loop(
+    qty: QtyArray,
+    avg_cost: PriceArray,
+    last_px: PriceArray,
+    out_mv: PriceArray,
+    out_upnl: PriceArray,
+) -> None:
+    """Scalar loop form of the kernel (the numba compilation source)."""
+    for i in range(qty.shape[0]):
+        px = last_px[i]
+        out_mv[i] = qty[i] * px
+        out_upnl[i] = (px - avg_cost[i]) * qty[i]
+
+
+def _mark_to_market_numpy(
+    qty: QtyArray,
+    avg_cost: PriceArray,
+    last_px: PriceArray,
+    out_mv: PriceArray,
+    out_upnl: PriceArray,
+) -> None:
+    """NumPy form of the kernel, used when numba is not installed."""
+    np.multiply(qty, last_px, out=out_mv)
+    np.subtract(last_px, avg_cost, out=out_upnl)
+    np.multiply(out_upnl, qty, out=out_upnl)
+
+
+try:
+    from numba import njit  # pyright: ignore[reportMissingImports, reportUnknownVariableType]
+
+    _kernel = cast(
+        MarkToMarket,
+        njit(cache=True, fastmath=True)(_mark_to_market_loop),
+    )
+except ImportError:  # pragma: no cover - depends on installed extras
+    _kernel = _mark_to_market_numpy
+
+# True when the numba-compiled kernel is in use
+JIT_ENABLED = _kernel is not _mark_to_market_numpy
+
+
+def mark_to_market(
+    qty: QtyArray,
+    avg_cost: PriceArray,
+    last_px: PriceArray,
+    out_mv: PriceArray,
+    out_upnl: PriceArray,
+) -> None:
+    """
+    Compute market value and unrealized PnL for every position in place.
+
+    All arrays must have the same length; row ``i`` describes one position.
+
+    Args:
+        qty: Signed position quantities (negative for shorts)
+        avg_cost: Average entry cost per unit
+        last_px: Latest traded price per unit
+        out_mv: Output array receiving ``qty * last_px``
+        out_upnl: Output array receiving ``(last_px - avg_cost) * qty``
+    """
+    _kernel(qty, avg_cost, last_px, out_mv, out_upnl)
@@ -0,0 +1,63 @@
+"""
+WebSocket message dispatch by ``type``.
+
+Handlers register for a message type with the ``@ws_handler`` decorator and
+incoming envelopes are routed with a single dict lookup instead of an if/elif
+chain over type strings:
+
+    @ws_handler("tick")
+    async def on_tick(data: dict[str, Any]) -> None: ...
+
+    await dispatch(WSMessage.from_json_bytes(raw))
+"""
+
+import sys
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+WSHandler = Callable[[Any], Awaitable[None]]
+
+HANDLERS: dict[str, WSHandler] = {}
+
+
+class _Envelope(Protocol):
+    @property
+    def type(self) -> str: ...
+
+    @property
+    def data(self) -> Any: ...
+
+
+def ws_handler(message_type: str) -> Callable[[WSHandler], WSHandler]:
+    """
+    Register the decorated coroutine function as the handler for a message type.
+
+    Args:
+        message_type: WSMessage.type value to handle (e.g., 'tick', 'order_batch')
+
+    Returns:
+        Decorator returning the handler unchanged
+    """
+
+    def decorator(handler: WSHandler) -> WSHandler:
+        HANDLERS[sys.intern(message_type)] = handler
+        return handler
+
+    return decorator
+
+
+async def dispatch(message: _Envelope) -> bool:
+    """
+    Route a message's data to the handler registered for its type.
+
+    Args:
+        message: Envelope with ``type`` and ``data`` (typically a WSMessage)
+
+    Returns:
+        True if a handler was found and awaited, False otherwise
+    """
+    handler = HANDLERS.get(message.type)
+    if handler is None:
+        return False
+    await handler(message.data)
+    return True
@@ -0,0 +1,57 @@
+"""Tests for outbound WebSocket message batching."""
+
+import asyncio
+
+import pytest
+
+from simutrador_core.utils.batched_sender import RECORD_SEPARATOR, BatchedSender
+
+
+class _Sink:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.frames: list[bytes] = []
+        self.error = error
+
+    async def send(self, message: bytes, /) -> None:
+        if self.error is not None:
+            raise self.error
+        self.frames.append(message)
+
+
+class TestBatchedSender:
+    def test_pending_messages_share_a_frame(self) -> None:
+        async def run() -> list[bytes]:
+            sink = _Sink()
+            sender = BatchedSender(sink)
+            sender.start()
+            sender.send(b"a")
+            sender.send(b"b")
+            await sender.close()
+            return sink.frames
+
+        assert asyncio.run(run()) == [b"a" + RECORD_SEPARATOR + b"b"]
+
+    def test_send_raises_after_writer_failure(self) -> None:
+        async def run() -> None:
+            sender = BatchedSender(_Sink(ConnectionError("closed")), flush_ms=0)
+            sender.start()
+            sender.send(b"a")
+            await asyncio.sleep(0.01)
+            sender.send(b"b")
+
+        with pytest.raises(ConnectionError, match="closed"):
+            asyncio.run(run())
+
+    def test_send_before_start_raises(self) -> None:
+        with pytest.raises(RuntimeError, match="not running"):
+            BatchedSender(_Sink()).send(b"a")
+
+    def test_send_after_close_raises(self) -> None:
+        async def run() -> None:
+            sender = BatchedSender(_Sink())
+            sender.start()
+            await sender.close()
+            sender.send(b"a")
+
+        with pytest.raises(RuntimeError, match="not running"):
+            asyncio.run(run())
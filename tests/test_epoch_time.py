@@ -0,0 +1,41 @@
+"""Tests for the epoch-nanosecond timestamp helpers."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from simutrador_core.utils.epoch_time import NS_PER_SECOND, datetime_to_ns, ns_to_datetime
+
+
+class TestEpochNanoseconds:
+    def test_epoch_is_zero(self) -> None:
+        assert datetime_to_ns(datetime(1970, 1, 1, tzinfo=UTC)) == 0
+        assert ns_to_datetime(0) == datetime(1970, 1, 1, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2024, 1, 1, 9, 30, tzinfo=UTC),
+            datetime(2024, 1, 1, 9, 30, 0, 123456, tzinfo=UTC),
+            datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+            datetime(2262, 4, 11, tzinfo=UTC),
+        ],
+    )
+    def test_round_trip_is_exact_to_the_microsecond(self, value: datetime) -> None:
+        assert ns_to_datetime(datetime_to_ns(value)) == value
+
+    def test_naive_is_treated_as_utc(self) -> None:
+        naive = datetime(2024, 1, 1, 9, 30, 0, 1)
+        aware = naive.replace(tzinfo=UTC)
+        assert datetime_to_ns(naive) == datetime_to_ns(aware)
+        assert datetime_to_ns(aware) == (1704101400 * NS_PER_SECOND) + 1000
+
+    def test_offset_is_applied(self) -> None:
+        eastern = datetime(2024, 1, 1, 4, 30, tzinfo=timezone(timedelta(hours=-5)))
+        assert datetime_to_ns(eastern) == datetime_to_ns(datetime(2024, 1, 1, 9, 30, tzinfo=UTC))
+        assert ns_to_datetime(datetime_to_ns(eastern)) == eastern
+        assert ns_to_datetime(datetime_to_ns(eastern)).tzinfo is UTC
+
+    def test_sub_microsecond_digits_are_floored(self) -> None:
+        assert ns_to_datetime(1_999) == datetime(1970, 1, 1, 0, 0, 0, 1, tzinfo=UTC)
+        assert ns_to_datetime(-1) == datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=UTC)
@@ -0,0 +1,31 @@
+"""Tests for the lazy package re-exports."""
+
+from types import ModuleType
+
+import pytest
+
+import simutrador_core
+from simutrador_core import models, utils
+from simutrador_core.models import websocket
+
+
+@pytest.mark.parametrize("package", [simutrador_core, models, websocket, utils])
+def test_all_names_resolve(package: ModuleType) -> None:
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+
+
+@pytest.mark.parametrize("package", [simutrador_core, models, websocket, utils])
+def test_exports_are_listed_in_all(package: ModuleType) -> None:
+    exports: dict[str, str] = getattr(package, "_EXPORTS")
+    assert set(exports) <= set(package.__all__)
+
+
+def test_models_reexports_websocket() -> None:
+    assert set(websocket.__all__) <= set(models.__all__)
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = models.missing  # pyright: ignore[reportAttributeAccessIssue]
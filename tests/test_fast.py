@@ -0,0 +1,181 @@
+"""Tests for the msgspec fast path."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from simutrador_core.models import (
+    ExecutionReportData,
+    HealthStatus,
+    OrderBatchData,
+    OrderData,
+    PriceCandle,
+    TickData,
+    Timeframe,
+    WSMessage,
+)
+from simutrador_core.models._fast import (
+    OrderBatchDataFast,
+    TickDataFast,
+    TypedMessageFast,
+    decode_msgpack,
+    decode_typed,
+    decode_ws,
+    encode_msgpack,
+    frame_to_model,
+    peek_type,
+    to_ws_message,
+)
+
+_TICK = (
+    b'{"type":"tick","data":{"sim_time":"2024-01-01T09:30:00Z","sequence_id":3,'
+    b'"candles":{"AAPL":{"date":"2024-01-01T09:30:00Z","open":"10","low":"9.5",'
+    b'"high":"10.5","close":"10.25","volume":"100"}}}}'
+)
+
+
+def _order_batch(quantity: int = 5, price: str = "1.5") -> bytes:
+    return (
+        b'{"type":"order_batch","data":{"batch_id":"b-1","orders":[{"order_id":"o-1",'
+        b'"symbol":"AAPL","side":"buy","type":"limit","quantity":%d,"price":"%b"}]}}'
+        % (quantity, price.encode())
+    )
+
+
+class TestDecodeTyped:
+    def test_known_type_uses_typed_decoder(self) -> None:
+        message = decode_typed(_TICK)
+        assert isinstance(message, TypedMessageFast)
+        assert isinstance(message.data, TickDataFast)
+        assert message.data.candles is not None
+        assert message.data.candles["AAPL"].close == Decimal("10.25")
+
+    def test_order_batch_is_typed(self) -> None:
+        message = decode_typed(_order_batch())
+        assert isinstance(message, TypedMessageFast)
+        assert isinstance(message.data, OrderBatchDataFast)
+        assert message.data.orders[0].price == Decimal("1.5")
+
+    def test_unknown_type_falls_back_to_ws_message(self) -> None:
+        message = decode_typed(b'{"type":"custom","data":{"a":1}}')
+        assert isinstance(message, WSMessage)
+        assert message.type == "custom"
+
+    def test_misleading_peek_falls_back_to_ws_message(self) -> None:
+        raw = b'{"data":{"type":"tick"},"type":"custom"}'
+        assert peek_type(raw) == "tick"
+        message = decode_typed(raw)
+        assert isinstance(message, WSMessage)
+        assert message.type == "custom"
+
+    def test_invalid_known_payload_raises(self) -> None:
+        with pytest.raises(msgspec.ValidationError):
+            decode_typed(b'{"type":"tick","data":{"sequence_id":1}}')
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            _order_batch(quantity=-5),
+            _order_batch(quantity=0),
+            _order_batch(price="-1.5"),
+            _TICK.replace(b'"volume":"100"', b'"volume":"-1"'),
+            _TICK.replace(b'"low":"9.5"', b'"low":"0"'),
+        ],
+    )
+    def test_out_of_range_values_are_rejected(self, raw: bytes) -> None:
+        with pytest.raises(msgspec.ValidationError):
+            decode_typed(raw)
+
+    def test_bounds_match_pydantic(self) -> None:
+        for field, value in (("quantity", -5), ("price", "-1.5")):
+            order = {"order_id": "o-1", "symbol": "AAPL", "side": "buy", "type": "limit"}
+            with pytest.raises(ValueError):
+                OrderData.model_validate({"quantity": 5, **order, field: value})
+
+
+class TestToWSMessage:
+    def test_matches_pydantic_envelope(self) -> None:
+        raw = b'{"type":"health","data":{"status":"ok"},"request_id":"r-1"}'
+        message = to_ws_message(decode_ws(raw))
+        assert message == WSMessage.from_json_bytes(raw)
+        assert HealthStatus.model_validate(message.data).status == "ok"
+
+
+_AT = datetime(2024, 1, 1, 9, 30, tzinfo=UTC)
+_CANDLE = PriceCandle(
+    date=_AT,
+    open=Decimal("10"),
+    low=Decimal("9.5"),
+    high=Decimal("10.5"),
+    close=Decimal("10.25"),
+    volume=Decimal("100"),
+)
+_ORDER = OrderData.model_validate(
+    {
+        "order_id": "o-1",
+        "symbol": "AAPL",
+        "side": "buy",
+        "type": "limit",
+        "quantity": 5,
+        "price": "1.5",
+    }
+)
+
+
+class TestMsgpack:
+    @pytest.mark.parametrize(
+        ("message_type", "payload"),
+        [
+            (
+                "tick",
+                TickData(
+                    sim_time=_AT,
+                    sequence_id=3,
+                    timeframe=Timeframe.ONE_MIN,
+                    candles={"AAPL": _CANDLE},
+                ),
+            ),
+            ("order_batch", OrderBatchData(batch_id="b-1", orders=[_ORDER])),
+            (
+                "execution_report",
+                ExecutionReportData.model_validate(
+                    {
+                        "execution_id": "e-1",
+                        "order_id": "o-1",
+                        "symbol": "AAPL",
+                        "executed_quantity": 5,
+                        "executed_price": "1.5",
+                        "commission": "0.01",
+                        "slippage_bps": 2,
+                        "timestamp": _AT,
+                    }
+                ),
+            ),
+        ],
+    )
+    def test_round_trip(self, message_type: str, payload: BaseModel) -> None:
+        decoded_type, frame = decode_msgpack(encode_msgpack(message_type, payload))
+        assert decoded_type == message_type
+        assert frame_to_model(decoded_type, frame) == payload
+
+    def test_unknown_type_raises_key_error(self) -> None:
+        with pytest.raises(KeyError):
+            encode_msgpack("pong", HealthStatus())
+        with pytest.raises(KeyError):
+            decode_msgpack(msgspec.msgpack.encode(("pong", {})))
+
+    @pytest.mark.parametrize(
+        ("message_type", "frame"),
+        [
+            ("order_batch", ["b-1", [["o-1", "AAPL", "buy", "limit", -5]]]),
+            ("order_batch", ["b-1", [["o-1", "AAPL", "buy", "limit", 5, "-1.5"]]]),
+            ("tick", [_AT, 1, None, {"AAPL": [_AT, "10", "9", "11", "10", "-1"]}]),
+            ("execution_report", ["e-1", "o-1", "AAPL", 5, "-1.5", "0", 0]),
+        ],
+    )
+    def test_out_of_range_values_are_rejected(self, message_type: str, frame: list[object]) -> None:
+        with pytest.raises(msgspec.ValidationError):
+            decode_msgpack(msgspec.msgpack.encode((message_type, frame)))
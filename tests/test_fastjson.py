@@ -0,0 +1,17 @@
+"""Tests for the fast JSON helpers."""
+
+from simutrador_core.utils.fastjson import encode_envelope, loads, raw_json
+
+
+class TestEncodeEnvelope:
+    def test_raw_json_is_embedded(self) -> None:
+        data = {"error_code": "X", "details": raw_json(b'{"upstream":[1,2]}')}
+        frame = encode_envelope("error", data, request_id="r-1")
+        assert loads(frame) == {
+            "type": "error",
+            "data": {"error_code": "X", "details": {"upstream": [1, 2]}},
+            "request_id": "r-1",
+        }
+
+    def test_bytes_payload_is_spliced(self) -> None:
+        assert encode_envelope("pong", b'{"a":1}') == b'{"type":"pong","data":{"a":1}}'
@@ -0,0 +1,44 @@
+"""Tests for the fixed-point price helpers."""
+
+from decimal import Decimal
+
+import pytest
+
+from simutrador_core.utils.fixed_point import (
+    PRICE_DECIMALS,
+    PRICE_SCALE,
+    from_minor_units,
+    to_minor_units,
+)
+
+
+class TestMinorUnits:
+    @pytest.mark.parametrize(
+        "value",
+        ["0", "187.25", "-42.5", "0.00000001", "-0.00000001", "99999999.99999999", "1e-8"],
+    )
+    def test_round_trip_at_scale(self, value: str) -> None:
+        assert from_minor_units(to_minor_units(value)) == Decimal(value)
+
+    def test_scale(self) -> None:
+        assert PRICE_SCALE == 10**PRICE_DECIMALS
+        assert to_minor_units(Decimal("1")) == PRICE_SCALE
+        assert to_minor_units(1) == PRICE_SCALE
+
+    @pytest.mark.parametrize(
+        ("value", "units"),
+        [
+            # Below the last place: round half to even
+            ("0.000000005", 0),
+            ("0.000000015", 2),
+            ("0.000000025", 2),
+            ("-0.000000015", -2),
+            ("0.0000000051", 1),
+        ],
+    )
+    def test_rounds_half_even_below_scale(self, value: str, units: int) -> None:
+        assert to_minor_units(value) == units
+
+    def test_custom_decimals(self) -> None:
+        assert to_minor_units("12.345", decimals=2) == 1234
+        assert from_minor_units(1234, decimals=2) == Decimal("12.34")
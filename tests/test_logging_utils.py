@@ -0,0 +1,63 @@
+"""Tests for the logging utilities."""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from simutrador_core.utils.logging_utils import setup_logger
+
+
+def _fresh_logger(name: str) -> None:
+    # Detach pytest's capture handlers, which would make setup_logger skip setup
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.handlers.clear()
+
+
+def _wait_for(path: Path, text: str, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and text in path.read_text():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSetupLogger:
+    def test_file_records_are_written(self, tmp_path: Path) -> None:
+        _fresh_logger("test_logging.file")
+        logger = setup_logger("test_logging.file", log_dir=tmp_path)
+        logger.error("parent record")
+        assert _wait_for(tmp_path / "test_logging_file.log", "parent record")
+
+    def test_repeated_setup_stops_previous_listener(self, tmp_path: Path) -> None:
+        _fresh_logger("test_logging.repeat")
+        logger = setup_logger("test_logging.repeat", log_dir=tmp_path)
+        threads = threading.active_count()
+        logger.handlers.clear()
+        setup_logger("test_logging.repeat", log_dir=tmp_path)
+        assert threading.active_count() == threads
+        logger.error("after repeat")
+        assert _wait_for(tmp_path / "test_logging_repeat.log", "after repeat")
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_forked_child_writes_file_records(self, tmp_path: Path) -> None:
+        _fresh_logger("test_logging.fork")
+        logger = setup_logger("test_logging.fork", log_dir=tmp_path)
+        log_file = tmp_path / "test_logging_fork.log"
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                logger.error("child record")
+                code = 0 if _wait_for(log_file, "child record") else 1
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert "child record" in log_file.read_text()
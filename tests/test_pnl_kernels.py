@@ -0,0 +1,40 @@
+"""Tests for the mark-to-market kernels."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from simutrador_core.utils import pnl_kernels
+from simutrador_core.utils.pnl_kernels import MarkToMarket, PriceArray, mark_to_market
+
+_loop_kernel: MarkToMarket = pnl_kernels._mark_to_market_loop  # pyright: ignore[reportPrivateUsage]
+_numpy_kernel: MarkToMarket = pnl_kernels._mark_to_market_numpy  # pyright: ignore[reportPrivateUsage]
+
+
+def _run(kernel: MarkToMarket, seed: int = 7) -> tuple[PriceArray, PriceArray]:
+    rng = np.random.default_rng(seed)
+    qty = rng.integers(-1_000, 1_000, size=64, dtype=np.int64)
+    avg_cost = rng.uniform(1.0, 500.0, size=64)
+    last_px = rng.uniform(1.0, 500.0, size=64)
+    out_mv = np.zeros(64, dtype=np.float64)
+    out_upnl = np.zeros(64, dtype=np.float64)
+    kernel(qty, avg_cost, last_px, out_mv, out_upnl)
+    return out_mv, out_upnl
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [_loop_kernel, mark_to_market],
+    ids=["python-loop", "active-kernel"],
+)
+def test_kernel_matches_numpy_fallback(kernel: Callable[..., None]) -> None:
+    expected_mv, expected_upnl = _run(_numpy_kernel)
+    out_mv, out_upnl = _run(kernel)
+    np.testing.assert_allclose(out_mv, expected_mv, rtol=1e-12)
+    np.testing.assert_allclose(out_upnl, expected_upnl, rtol=1e-12)
+
+
+def test_jit_kernel_is_used_when_numba_is_installed() -> None:
+    pytest.importorskip("numba")
+    assert pnl_kernels.JIT_ENABLED
@@ -0,0 +1,71 @@
+"""Tests for the struct-of-arrays position store."""
+
+from decimal import Decimal
+
+import pytest
+
+from simutrador_core.models import AccountSnapshotData, PositionData, PositionStore
+
+
+def _positions(store: PositionStore) -> dict[str, tuple[int, Decimal]]:
+    return {p.symbol: (p.quantity, p.avg_cost) for p in store.to_positions()}
+
+
+class TestPositionStore:
+    def test_set_position_overwrites(self) -> None:
+        store = PositionStore()
+        store.set_position("AAPL", 100, Decimal("187.25"))
+        store.set_position("AAPL", -20, Decimal("190.5"))
+        assert len(store) == 1
+        assert _positions(store) == {"AAPL": (-20, Decimal("190.5"))}
+
+    def test_remove_moves_last_row_into_slot(self) -> None:
+        store = PositionStore()
+        store.set_position("AAPL", 1, Decimal("10"))
+        store.set_position("MSFT", 2, Decimal("20"))
+        store.set_position("TSLA", 3, Decimal("30"))
+        store.update_prices({"TSLA": 33.0})
+        store.remove("AAPL")
+        assert list(store) == ["TSLA", "MSFT"]
+        assert "AAPL" not in store
+        assert _positions(store) == {"TSLA": (3, Decimal("30")), "MSFT": (2, Decimal("20"))}
+        market_value, unrealized = store.mark()
+        assert market_value.tolist() == [99.0, 40.0]
+        assert unrealized.tolist() == [9.0, 0.0]
+        # The moved symbol is still addressable by its new row
+        store.update_prices({"TSLA": 31.0})
+        assert store.mark()[0].tolist() == [93.0, 40.0]
+
+    def test_remove_unknown_symbol_raises(self) -> None:
+        with pytest.raises(KeyError):
+            PositionStore().remove("AAPL")
+
+    def test_grows_past_initial_capacity(self) -> None:
+        store = PositionStore(capacity=2)
+        for i in range(5):
+            store.set_position(f"S{i}", i + 1, Decimal(i + 1))
+        store.update_prices({f"S{i}": 2.0 * (i + 1) for i in range(5)})
+        assert len(store) == 5
+        assert _positions(store) == {f"S{i}": (i + 1, Decimal(i + 1)) for i in range(5)}
+        market_value, unrealized = store.mark()
+        assert market_value.tolist() == [2.0 * (i + 1) ** 2 for i in range(5)]
+        assert unrealized.tolist() == [float((i + 1) ** 2) for i in range(5)]
+
+    def test_snapshot_matches_pydantic_path(self) -> None:
+        store = PositionStore()
+        store.set_position("AAPL", 100, Decimal("187.25"))
+        store.set_position("BTC", -2, Decimal("0.12345678"))
+        store.update_prices({"AAPL": Decimal("188.10"), "BTC": 0.2, "MSFT": 1.0})
+        cash = Decimal("81275.00")
+
+        positions = [
+            PositionData(symbol="AAPL", quantity=100, avg_cost=Decimal("187.25")),
+            PositionData(symbol="BTC", quantity=-2, avg_cost=Decimal("0.12345678")),
+        ]
+        equity = cash + Decimal("188.10") * 100 + Decimal("0.2") * -2
+        expected = AccountSnapshotData(cash=cash, equity=equity, positions=positions)
+
+        snapshot = store.to_snapshot(cash)
+        assert snapshot.positions == expected.positions
+        assert snapshot.equity == expected.equity
+        assert snapshot == expected
@@ -0,0 +1,46 @@
+"""Tests for the price data models."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from simutrador_core.models import CandleBatch, PriceCandle
+
+_AT = datetime(2024, 1, 1, 9, 30, tzinfo=UTC)
+
+
+def _candle(close: str, volume: str = "100") -> PriceCandle:
+    return PriceCandle(
+        date=_AT,
+        open=Decimal("10.00"),
+        low=Decimal("9.50"),
+        high=Decimal("12.00"),
+        close=Decimal(close),
+        volume=Decimal(volume),
+    )
+
+
+class TestCandleBatch:
+    def test_round_trip_preserves_candles(self) -> None:
+        candles = {
+            "AAPL": _candle("10.25"),
+            "BTC": _candle("11.12345678", volume="0.00000001"),
+            "MSFT": _candle("9.5", volume="0"),
+        }
+        batch = CandleBatch.from_candles(candles)
+        assert len(batch) == 3
+        assert batch.symbols == ["AAPL", "BTC", "MSFT"]
+        assert batch.as_dict() == candles
+
+    def test_empty_mapping(self) -> None:
+        batch = CandleBatch.from_candles({})
+        assert len(batch) == 0
+        assert batch.as_dict() == {}
+
+    def test_mismatched_columns_raise(self) -> None:
+        with pytest.raises(ValidationError, match="same length"):
+            CandleBatch(
+                symbols=["AAPL"], dates=[], open=[1], high=[1], low=[1], close=[1], volume=[1]
+            )
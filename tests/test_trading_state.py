@@ -0,0 +1,66 @@
+"""Tests for the session trading state models."""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from simutrador_core.models.trading_state import PositionBracketState, SessionTradingState
+
+_AAPL = {"symbol": "AAPL", "quantity": 10, "avg_cost": "187.25"}
+_ORDER = {"order_id": "o-1", "symbol": "AAPL", "side": "buy", "quantity": 10}
+
+
+class TestSessionTradingState:
+    def test_legacy_lists_are_keyed(self) -> None:
+        state = SessionTradingState.model_validate(
+            {"cash": "1000", "positions": [_AAPL], "open_orders": [_ORDER]}
+        )
+        assert state.positions["AAPL"].avg_cost == Decimal("187.25")
+        assert state.open_orders["o-1"].symbol == "AAPL"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"positions": [_AAPL, {**_AAPL, "quantity": 5}]},
+            {"open_orders": [_ORDER, _ORDER]},
+        ],
+    )
+    def test_duplicate_list_key_raises(self, data: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError, match="duplicate"):
+            SessionTradingState.model_validate({"cash": "1000", **data})
+
+    @pytest.mark.parametrize("symbol", [["A"], {"a": 1}, 1])
+    def test_non_string_list_key_raises(self, symbol: object) -> None:
+        with pytest.raises(ValidationError, match="symbol must be a string"):
+            SessionTradingState.model_validate(
+                {"cash": "1000", "positions": [{**_AAPL, "symbol": symbol}]}
+            )
+
+    def test_missing_list_key_raises(self) -> None:
+        with pytest.raises(ValidationError, match="missing 'symbol'"):
+            SessionTradingState.model_validate(
+                {"cash": "1000", "last_prices": [{"last_price": 1.0}]}
+            )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"positions": {"MSFT": _AAPL}},
+            {"open_orders": {"o-2": _ORDER}},
+        ],
+    )
+    def test_mismatched_dict_key_raises(self, data: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError, match="does not match"):
+            SessionTradingState.model_validate({"cash": "1000", **data})
+
+
+class TestPositionBracketState:
+    def test_levels_are_floats_with_decimal_views(self) -> None:
+        bracket = PositionBracketState.model_validate(
+            {"symbol": "AAPL", "side": "buy", "quantity": 10, "stop_loss": "180.10"}
+        )
+        assert bracket.stop_loss == 180.1
+        assert bracket.stop_loss_decimal == Decimal("180.1")
+        assert bracket.take_profit_decimal is None
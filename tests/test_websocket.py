@@ -0,0 +1,140 @@
+"""Tests for WebSocket message parsing and encoding."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from simutrador_core.models import (
+    BatchedMessagesData,
+    BatchMessage,
+    PongData,
+    PongMessage,
+    PriceCandle,
+    TickData,
+    Timeframe,
+    WSMessage,
+    decode_payload,
+    encode_tick_message,
+    parse_ws_message,
+)
+from simutrador_core.utils.fastjson import loads
+
+
+class TestParseWSMessage:
+    def test_known_type_is_typed(self) -> None:
+        message = parse_ws_message(b'{"type":"pong","data":{"server_time":"2024-01-01T00:00:00"}}')
+        assert type(message) is PongMessage
+        assert isinstance(message.data, PongData)
+
+    def test_unknown_type_is_generic(self) -> None:
+        message = parse_ws_message(b'{"type":"custom","data":{"a":1}}')
+        assert isinstance(message, WSMessage)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"type":[1],"data":{}}',
+            b'{"type":{"a":1},"data":{}}',
+            b'{"type":1,"data":{}}',
+        ],
+    )
+    def test_non_string_type_raises_validation_error(self, raw: bytes) -> None:
+        with pytest.raises(ValidationError):
+            parse_ws_message(raw)
+
+
+class TestDecodePayload:
+    def test_known_type_is_validated(self) -> None:
+        message_type, payload = decode_payload(
+            b'{"type":"pong","data":{"server_time":"2024-01-01T00:00:00"}}'
+        )
+        assert message_type == "pong"
+        assert isinstance(payload, PongData)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b"not json",
+            b"[1,2]",
+            b'"tick"',
+            b'{"type":1,"data":{}}',
+            b'{"type":["tick"],"data":{}}',
+            b'{"data":{}}',
+            b'{"type":"tick"}',
+        ],
+    )
+    def test_malformed_frame_raises_value_error(self, raw: bytes) -> None:
+        with pytest.raises(ValueError):
+            decode_payload(raw)
+
+
+class TestToBytes:
+    def test_sets_are_encoded_as_arrays(self) -> None:
+        message = WSMessage.model_validate(
+            {"type": "custom", "data": {"tags": {"a"}, "ids": frozenset({1})}}
+        )
+        assert loads(message.to_bytes())["data"] == {"tags": ["a"], "ids": [1]}
+
+    def test_utc_datetimes_are_encoded_alike(self) -> None:
+        at = datetime(2024, 1, 1, tzinfo=UTC)
+        data = {"at": at, "pong": PongData(server_time=at)}
+        message = WSMessage.model_validate({"type": "custom", "data": data, "timestamp": at})
+        decoded = loads(message.to_bytes())
+        assert decoded["timestamp"] == "2024-01-01T00:00:00Z"
+        assert decoded["data"] == {
+            "at": "2024-01-01T00:00:00Z",
+            "pong": {"server_time": "2024-01-01T00:00:00Z"},
+        }
+
+
+class TestEncodeTickMessage:
+    def test_matches_to_bytes(self) -> None:
+        at = datetime(2024, 1, 1, 9, 30, tzinfo=UTC)
+        candle = PriceCandle(
+            date=at,
+            open=Decimal("10"),
+            low=Decimal("9.5"),
+            high=Decimal("10.5"),
+            close=Decimal("10.25"),
+            volume=Decimal("100"),
+        )
+        tick = TickData(
+            sim_time=at, sequence_id=7, timeframe=Timeframe.ONE_MIN, candles={"AAPL": candle}
+        )
+        message = WSMessage.model_validate({"type": "tick", "data": tick.model_dump()})
+        expected = loads(message.to_bytes())
+        for extra in ("market_session", "symbols_trading", "is_eod"):
+            del expected["data"][extra]
+        del expected["request_id"], expected["timestamp"]
+        assert loads(encode_tick_message(tick)) == expected
+
+
+class TestBatchedMessages:
+    def test_inner_messages_are_typed(self) -> None:
+        message = parse_ws_message(
+            b'{"type":"batch","data":{"messages":['
+            b'{"type":"pong","data":{"server_time":"2024-01-01T00:00:00Z"}},'
+            b'{"type":"custom","data":{"a":1}}]}}'
+        )
+        assert type(message) is BatchMessage
+        assert isinstance(message.data, BatchedMessagesData)
+        pong, custom = message.data.messages
+        assert type(pong) is PongMessage
+        assert isinstance(pong.data, PongData)
+        assert type(custom) is WSMessage
+
+
+class TestTypedWSMessage:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"type":"pong","data":{"server_time":"2024-01-01T00:00:00Z"}}',
+            b'{"type":"custom","data":{}}',
+        ],
+    )
+    def test_parsed_envelopes_are_frozen(self, raw: bytes) -> None:
+        message = parse_ws_message(raw)
+        with pytest.raises(ValidationError):
+            message.request_id = "r-1"